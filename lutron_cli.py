@@ -4,18 +4,16 @@ Lutron Command Line Interface - Unified CLI for all Lutron operations
 """
 import argparse
 import sys
-import time
-from src.lutron_controller import LutronController
-from src.lutron_zones import (
-    KITCHEN, KITCHEN_ALL, MASTER_BEDROOM, 
-    get_zone_names, print_zones
-)
+
+# The controller and zone tables are imported inside the handlers that
+# need them, so cheap paths (list, --help, argparse errors) don't pay
+# for the socket stack on every one-shot invocation
 
 # Hardcoded bridge IP address
 DEFAULT_BRIDGE_IP = "192.168.49.91"
 
-def parse_args():
-    """Parse command line arguments for the unified CLI"""
+def _build_parser():
+    """Build the argument parser for the unified CLI"""
     # Create the main parser
     parser = argparse.ArgumentParser(
         description='Lutron Caseta Telnet Controller CLI',
@@ -110,11 +108,21 @@ Examples:
     # LIST command - list available zones
     list_parser = subparsers.add_parser('list', help='List available zones')
     list_parser.add_argument('--area', '-a', help='Filter zones by area name')
-    
-    return parser.parse_args()
+
+    return parser
+
+# Build the parser (subparsers and all) once at import; repeated
+# parse_args calls reuse it instead of reallocating the whole tree
+_PARSER = _build_parser()
+
+def parse_args():
+    """Parse command line arguments for the unified CLI"""
+    return _PARSER.parse_args()
 
 def control_zone(args):
     """Control a single zone"""
+    from src.lutron_controller import LutronController
+
     with LutronController(args.ip) as controller:
         if not controller.connected:
             print(f"Failed to connect to bridge at {args.ip}")
@@ -135,6 +143,9 @@ def control_zone(args):
 
 def control_room(args):
     """Control all lights in a room"""
+    from src.lutron_controller import LutronController
+    from src.lutron_zones import KITCHEN_ALL, MASTER_BEDROOM, print_zones
+
     # Select room
     if args.room_name == 'kitchen':
         room_zones = KITCHEN_ALL
@@ -180,46 +191,42 @@ def control_room(args):
 def monitor_bridge(args):
     """Monitor bridge activity (imported from lutron_monitor.py)"""
     from scripts.lutron_monitor import main as monitor_main
-    # Create sys.argv for the monitor module
-    sys.argv = [sys.argv[0]]
-    if args.ip != DEFAULT_BRIDGE_IP:
-        sys.argv.extend(['--ip', args.ip])
-    if args.timeout != 60:
-        sys.argv.extend(['--timeout', str(args.timeout)])
-    
-    return monitor_main()
+    # Pass the settings directly instead of rewriting sys.argv and
+    # having the monitor re-parse them through its own argparse
+    return monitor_main(ip=args.ip, timeout=args.timeout)
 
 def list_zones(args):
     """List available zones"""
-    all_zones = []
-    
-    # Add kitchen zones
-    all_zones.extend(KITCHEN_ALL)
-    
-    # Add bedroom zones
-    all_zones.append(MASTER_BEDROOM["BAY_WINDOW"])
-    
+    from collections import defaultdict
+    from src.lutron_zones import ALL_ZONES
+
+    # Index zones by lowercased area once; the filter then matches
+    # against a handful of area keys instead of lowering every zone's
+    # area and name per comparison
+    zones_by_area = defaultdict(list)
+    for zone in ALL_ZONES:
+        zones_by_area[zone.area.lower()].append(zone)
+
+    all_zones = list(ALL_ZONES)
+
     # Filter by area if specified
     if args.area:
-        area_lower = args.area.lower()
-        filtered_zones = []
-        for zone in all_zones:
-            # Check area in name
-            if 'kitchen' in area_lower and 'kitchen' in zone.area.lower():
-                filtered_zones.append(zone)
-            elif 'bedroom' in area_lower and 'bedroom' in zone.area.lower():
-                filtered_zones.append(zone)
-            # Also check name directly
-            elif area_lower in zone.name.lower():
-                filtered_zones.append(zone)
-        all_zones = filtered_zones
+        needle = args.area.lower()
+        all_zones = [zone
+                     for area, zone_list in zones_by_area.items()
+                     if needle in area
+                     for zone in zone_list]
+        if not all_zones:
+            # Fall back to matching against zone names directly
+            all_zones = [zone for zone in ALL_ZONES
+                         if needle in zone.name.lower()]
     
-    # Print zones
+    # Print zones - build the listing and write it in one go
     if all_zones:
-        print("\nAvailable Zones:")
-        print("-" * 16)
-        for zone in sorted(all_zones, key=lambda z: z.id):
-            print(f"  Zone {zone.id:>2}: {zone.name} ({zone.area})")
+        lines = ["\nAvailable Zones:\n", "-" * 16 + "\n"]
+        lines.extend(f"  Zone {zone.id:>2}: {zone.name} ({zone.area})\n"
+                     for zone in sorted(all_zones, key=lambda z: z.id))
+        sys.stdout.write("".join(lines))
     else:
         if args.area:
             print(f"No zones found matching '{args.area}'")
@@ -230,6 +237,9 @@ def list_zones(args):
 
 def run_show(args):
     """Run a light show sequence"""
+    from src.lutron_controller import LutronController
+    from src.lutron_zones import KITCHEN_ALL
+
     if args.show_name == 'kitchen-standard':
         from scripts.kitchen_show import run_light_show
     elif args.show_name == 'kitchen-optimized':
@@ -255,7 +265,9 @@ def run_show(args):
 def run_party(args):
     """Run the kitchen party lights"""
     from scripts.kitchen_party import run_party_lights
-    
+    from src.lutron_controller import LutronController
+    from src.lutron_zones import KITCHEN_ALL
+
     # Create controller and run party
     with LutronController(args.ip) as controller:
         if not controller.connected:
@@ -2,70 +2,73 @@
 """
 Bedroom Lights - Control master bedroom bay window lights
 """
-import argparse
 import sys
-from src.lutron_controller import LutronController
-from src.lutron_zones import MASTER_BEDROOM
 
 # Hardcoded bridge IP address
 DEFAULT_BRIDGE_IP = "192.168.49.91"
 
+# Fixed commands map straight to a level without building the argparse tree
+FAST_LEVELS = {"on": 100.0, "off": 0.0, "half": 50.0}
+
 def parse_args():
+    import argparse
+
     parser = argparse.ArgumentParser(description='Control Master Bedroom Lights')
-    parser.add_argument('--ip', '-i', default=DEFAULT_BRIDGE_IP, 
+    parser.add_argument('--ip', '-i', default=DEFAULT_BRIDGE_IP,
                         help=f'IP address of the Lutron bridge (default: {DEFAULT_BRIDGE_IP})')
-    
+
     # Command subparsers
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
     subparsers.required = True
-    
+
     # ON command
     subparsers.add_parser('on', help='Turn bedroom lights ON')
-    
+
     # OFF command
     subparsers.add_parser('off', help='Turn bedroom lights OFF')
-    
+
     # Set to 50% command
     subparsers.add_parser('half', help='Set bedroom lights to 50% brightness')
-    
+
     # SET command
     set_parser = subparsers.add_parser('set', help='Set bedroom lights to specific level')
-    set_parser.add_argument('--level', '-l', type=float, required=True, 
+    set_parser.add_argument('--level', '-l', type=float, required=True,
                          help='Brightness level (0.0-100.0)')
-    
+
     return parser.parse_args()
 
-def main():
-    args = parse_args()
-    
-    # Create controller and connect
-    with LutronController(args.ip) as controller:
+def control_light(ip, level):
+    """Connect to the bridge and set the bay window lights"""
+    from src.lutron_controller import LutronController
+    from src.lutron_zones import MASTER_BEDROOM
+
+    # Get the bay window light info
+    bay_window = MASTER_BEDROOM["BAY_WINDOW"]
+
+    with LutronController(ip) as controller:
         if not controller.connected:
             print("Failed to connect to the bridge")
             return 1
-        
-        # Get the bay window light info
-        bay_window = MASTER_BEDROOM["BAY_WINDOW"]
-        zone_id = bay_window["id"]
-        name = bay_window["name"]
-        
-        # Determine the brightness level based on command
-        if args.command == 'on':
-            print(f"Turning {name} ON")
-            level = 100.0
-        elif args.command == 'off':
-            print(f"Turning {name} OFF")
-            level = 0.0
-        elif args.command == 'half':
-            print(f"Setting {name} to 50%")
-            level = 50.0
-        elif args.command == 'set':
-            level = max(0.0, min(100.0, args.level))
-            print(f"Setting {name} to {level}%")
-        
-        # Control the light
-        controller.set_light(zone_id, level)
+
+        print(f"Setting {bay_window.name} to {level}%")
+        controller.set_light(bay_window.id, level)
         return 0
 
+def main():
+    # Fast path: a plain on/off/half invocation skips argparse and the
+    # controller imports entirely until the level is known
+    if len(sys.argv) == 2 and sys.argv[1] in FAST_LEVELS:
+        return control_light(DEFAULT_BRIDGE_IP, FAST_LEVELS[sys.argv[1]])
+
+    args = parse_args()
+
+    # Determine the brightness level based on command
+    if args.command in FAST_LEVELS:
+        level = FAST_LEVELS[args.command]
+    elif args.command == 'set':
+        level = max(0.0, min(100.0, args.level))
+
+    return control_light(args.ip, level)
+
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
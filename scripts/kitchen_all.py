@@ -16,8 +16,9 @@ def parse_args():
                         help=f'IP address of the Lutron bridge (default: {DEFAULT_BRIDGE_IP})')
     parser.add_argument('--mode', '-m', choices=['sequential', 'batch'], default='batch',
                         help='Control mode: sequential (one by one) or batch (all at once)')
-    parser.add_argument('--delay', '-d', type=float, default=0.5,
-                        help='Delay between commands in sequential mode (seconds, default: 0.5)')
+    parser.add_argument('--delay', '-d', type=float, default=0.0,
+                        help='Extra delay between commands in sequential mode '
+                             '(seconds, default: 0 - commands already wait for the prompt)')
     
     # Command subparsers
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
@@ -3,11 +3,14 @@
 Kitchen Party Lights - Randomized light show that runs until interrupted
 """
 import argparse
+import functools
 import sys
 import time
 import random
 import os
+import queue
 import signal
+import threading
 
 # Add parent directory to path to allow imports when run directly
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -36,6 +39,14 @@ EMOJIS = [
     "✨", "🎉", "🔥", "🌟", "💫", "⚡", "🎵", "🎊", "🎭", "🥳", "🚀", "💥", "🎇", "🎆"
 ]
 
+# Level palettes drawn inside the pattern loops, built once
+FLASH_LEVELS = (0, 50, 100)
+ACTIVE_LEVELS = (50, 100)
+
+# Pulse ramp steps; constant per show, no need to re-range every cycle
+PULSE_UP = tuple(range(0, 101, 10))
+PULSE_DOWN = tuple(range(100, -1, -10))
+
 # Patterns for the light show
 PATTERNS = [
     "flash_all",         # Flash all lights together
@@ -56,11 +67,35 @@ def random_emoji():
     """Return a random fun emoji"""
     return random.choice(EMOJIS)
 
+# Party messages go through a background writer thread: the pattern
+# loop pays a queue put instead of a write/flush to a possibly slow
+# tty (an ssh session can block for tens of ms), so strobe frame rate
+# is decoupled from stdout latency
+_logq = queue.SimpleQueue()
+_log_thread = None
+
+def _drain_log():
+    while True:
+        sys.stdout.write(_logq.get())
+        sys.stdout.flush()
+
+# Every color/emoji pairing pre-rendered once: a message costs one
+# randrange and two tuple fetches instead of two random.choice calls
+# plus a six-substitution f-string. Index i keeps the same emoji on
+# both ends, exactly like the formatted original
+_PREFIXES = tuple(f"{color}{emoji} " for color in COLORS for emoji in EMOJIS)
+_SUFFIXES = tuple(f" {emoji}{RESET}\n" for color in COLORS for emoji in EMOJIS)
+_randrange = random.randrange
+
 def print_party(message):
-    """Print a colorful party message"""
-    color = random_color()
-    emoji = random_emoji()
-    print(f"{color}{emoji} {message} {emoji}{RESET}")
+    """Queue a colorful party message for the background writer"""
+    global _log_thread
+    if _log_thread is None:
+        _log_thread = threading.Thread(target=_drain_log, daemon=True)
+        _log_thread.start()
+
+    i = _randrange(len(_PREFIXES))
+    _logq.put(_PREFIXES[i] + message + _SUFFIXES[i])
 
 def parse_args():
     """Parse command line arguments"""
@@ -78,68 +113,77 @@ def parse_args():
 def flash_all(controller, zones, duration, min_interval, max_interval):
     """Flash all lights on and off"""
     print_party("FLASH ALL LIGHTS")
-    end_time = time.time() + duration
-    
-    while time.time() < end_time:
-        # Choose a random level (on, off, or dim)
-        level = random.choice([0, 50, 100])
-        
-        # Flash all lights together
-        controller.set_lights_batch(zones, level)
-        
+    # Bind the frame loop's callables to locals once; the repeated
+    # attribute lookups add up at flash rate
+    _pc = time.perf_counter
+    _sleep = time.sleep
+    _batch = controller.set_lights_batch
+    _uniform = random.uniform
+    end_time = _pc() + duration
+
+    # One choices() call draws the whole pattern's levels up front,
+    # amortizing the RNG machinery across the batch
+    levels = iter(random.choices(FLASH_LEVELS, k=256))
+
+    while _pc() < end_time:
+        # Flash all lights together at a random level (on, off, or dim)
+        level = next(levels, None)
+        if level is None:
+            levels = iter(random.choices(FLASH_LEVELS, k=256))
+            level = next(levels)
+        _batch(zones, level)
+
         # Wait a random interval
-        interval = random.uniform(min_interval, max_interval)
-        time.sleep(interval)
+        _sleep(_uniform(min_interval, max_interval))
 
 def chase(controller, zones, duration, min_interval, max_interval):
     """Chase pattern - one light at a time"""
     print_party("CHASE PATTERN")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
-    while time.time() < end_time:
-        # Turn all lights off
-        controller.set_lights_batch(zones, 0)
-        
-        # Turn on one light at a time
+    while time.perf_counter() < end_time:
+        # One frame per active light: that zone lit, every other zone
+        # dark, sent as a single pipelined write (the level cache drops
+        # the zones that are already off)
         for zone in zones:
-            # Random level for the active light
-            level = random.choice([50, 100])
-            controller.set_light(zone, level)
-            
+            level = random.choice(ACTIVE_LEVELS)
+            frame = {z.id: 0 for z in zones}
+            frame[zone.id] = level
+            controller.set_zone_levels(frame, verbose=False)
+
             # Random interval
             interval = random.uniform(min_interval, max_interval)
             time.sleep(interval)
-            
+
             # Turn off before moving to next
             controller.set_light(zone, 0)
 
 def random_individual(controller, zones, duration, min_interval, max_interval):
     """Random individual lights"""
     print_party("RANDOM INDIVIDUAL LIGHTS")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
-    while time.time() < end_time:
-        # Select a random zone
-        zone = random.choice(zones)
-        
-        # Choose a random level
-        level = random.choice([0, 50, 100])
-        
-        # Set the light
-        controller.set_light(zone, level)
-        
+    _pc = time.perf_counter
+    _sleep = time.sleep
+    _set = controller.set_light
+    _choice = random.choice
+    _uniform = random.uniform
+
+    while _pc() < end_time:
+        # Set a random zone to a random level
+        _set(_choice(zones), _choice(FLASH_LEVELS))
+
         # Wait a random interval
-        interval = random.uniform(min_interval, max_interval)
-        time.sleep(interval)
+        _sleep(_uniform(min_interval, max_interval))
 
 def wave(controller, zones, duration, min_interval, max_interval):
     """Wave pattern from left to right"""
     print_party("WAVE PATTERN")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
-    while time.time() < end_time:
+    while time.perf_counter() < end_time:
         # Choose a level for this wave
-        level = random.choice([50, 100])
+        level = random.choice(ACTIVE_LEVELS)
         
         # Wave forward
         for zone in zones:
@@ -160,80 +204,91 @@ def wave(controller, zones, duration, min_interval, max_interval):
 def pulse(controller, zones, duration, min_interval, max_interval):
     """Pulse all lights up and down"""
     print_party("PULSE EFFECT")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
-    while time.time() < end_time:
+    _pc = time.perf_counter
+    _sleep = time.sleep
+    _batch = controller.set_lights_batch
+
+    while _pc() < end_time:
         # Pulse up
-        for level in range(0, 101, 10):
-            controller.set_lights_batch(zones, level)
-            time.sleep(min_interval)
-        
+        for level in PULSE_UP:
+            _batch(zones, level)
+            _sleep(min_interval)
+
         # Pulse down
-        for level in range(100, -1, -10):
-            controller.set_lights_batch(zones, level)
-            time.sleep(min_interval)
-        
+        for level in PULSE_DOWN:
+            _batch(zones, level)
+            _sleep(min_interval)
+
         # Random pause between pulses
-        time.sleep(random.uniform(min_interval, max_interval))
+        _sleep(random.uniform(min_interval, max_interval))
 
 def strobe(controller, zones, duration, min_interval, max_interval):
     """Quick strobe effect"""
     print_party("STROBE EFFECT")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
     # Use shortest interval for strobe
     strobe_interval = min_interval / 2
-    
-    while time.time() < end_time:
+
+    # The strobe loop is the tightest in the show - keep its bytecode
+    # down to local loads
+    _pc = time.perf_counter
+    _sleep = time.sleep
+    _batch = controller.set_lights_batch
+    _random = random.random
+
+    while _pc() < end_time:
         # Strobe on
-        controller.set_lights_batch(zones, 100)
-        time.sleep(strobe_interval)
-        
+        _batch(zones, 100)
+        _sleep(strobe_interval)
+
         # Strobe off
-        controller.set_lights_batch(zones, 0)
-        time.sleep(strobe_interval)
-        
+        _batch(zones, 0)
+        _sleep(strobe_interval)
+
         # Every few strobe cycles, pause briefly
-        if random.random() < 0.2:  # 20% chance
-            time.sleep(max_interval)
+        if _random() < 0.2:  # 20% chance
+            _sleep(max_interval)
 
 def alternate(controller, zones, duration, min_interval, max_interval):
     """Alternate between different lights"""
     print_party("ALTERNATING PATTERN")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
     # Split into two groups
     group_a = zones[::2]  # Even indices
     group_b = zones[1::2]  # Odd indices
     
-    while time.time() < end_time:
+    # Both groups' levels for a frame, prebuilt once - each flip is a
+    # single pipelined write instead of a command per zone
+    a_on = {zone.id: 100 for zone in group_a}
+    a_on.update((zone.id, 0) for zone in group_b)
+    b_on = {zone.id: 0 for zone in group_a}
+    b_on.update((zone.id, 100) for zone in group_b)
+
+    while time.perf_counter() < end_time:
         # Group A on, Group B off
-        for zone in group_a:
-            controller.set_light(zone, 100)
-        for zone in group_b:
-            controller.set_light(zone, 0)
-        
+        controller.set_zone_levels(a_on, verbose=False)
+
         time.sleep(random.uniform(min_interval, max_interval))
-        
+
         # Group A off, Group B on
-        for zone in group_a:
-            controller.set_light(zone, 0)
-        for zone in group_b:
-            controller.set_light(zone, 100)
-        
+        controller.set_zone_levels(b_on, verbose=False)
+
         time.sleep(random.uniform(min_interval, max_interval))
 
 def random_levels(controller, zones, duration, min_interval, max_interval):
     """Set random brightness levels"""
     print_party("RANDOM BRIGHTNESS LEVELS")
-    end_time = time.time() + duration
+    end_time = time.perf_counter() + duration
     
-    while time.time() < end_time:
-        # Set each light to a random level
-        for zone in zones:
-            level = random.randint(0, 100)
-            controller.set_light(zone, level)
-        
+    while time.perf_counter() < end_time:
+        # Draw every zone's level, then send the whole frame at once
+        frame = {zone.id: random.randint(0, 100) for zone in zones}
+        controller.set_zone_levels(frame, verbose=False)
+
         # Wait a random interval
         interval = random.uniform(min_interval, max_interval)
         time.sleep(interval)
@@ -251,27 +306,30 @@ def run_party_lights(controller, min_interval=0.2, max_interval=2.0, pattern_dur
     print("\n🎵 Starting Kitchen Party Lights! 🎵\n")
     print("Press Ctrl+C to stop the party\n")
     
-    # Pattern functions map
-    patterns = {
-        "flash_all": flash_all,
-        "chase": chase,
-        "random_individual": random_individual,
-        "wave": wave, 
-        "pulse": pulse,
-        "strobe": strobe,
-        "alternate": alternate,
-        "random_levels": random_levels
-    }
-    
+    # Bind each pattern's five arguments once; a switch becomes an
+    # index into a tuple and a no-arg call instead of a name lookup
+    # plus a five-argument dispatch. Order mirrors PATTERNS
+    bound = tuple(
+        functools.partial(fn, controller, KITCHEN_ALL, pattern_duration,
+                          min_interval, max_interval)
+        for fn in (flash_all, chase, random_individual, wave, pulse,
+                   strobe, alternate, random_levels)
+    )
+
+    # Draw pattern picks in batches rather than one random call per
+    # switch; refilled whenever the batch runs out
+    indices = range(len(bound))
+    pattern_iter = iter(random.choices(indices, k=256))
+
     try:
         while True:
-            # Select a random pattern
-            pattern_name = random.choice(PATTERNS)
-            pattern_func = patterns[pattern_name]
-            
-            # Run the pattern
-            pattern_func(controller, KITCHEN_ALL, pattern_duration, min_interval, max_interval)
-    
+            # Select and run a random pattern
+            idx = next(pattern_iter, None)
+            if idx is None:
+                pattern_iter = iter(random.choices(indices, k=256))
+                idx = next(pattern_iter)
+            bound[idx]()
+
     except KeyboardInterrupt:
         print("\n\n🎉 Party's over! Turning all lights off... 🎉")
         controller.set_lights_batch(KITCHEN_ALL, 0.0)
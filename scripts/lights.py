@@ -4,7 +4,9 @@ Lights - Control any list of lights by zone ID
 """
 import argparse
 import sys
+import time
 from src.lutron_controller import LutronController
+from src.lutron_daemon import send_via_daemon
 
 # Hardcoded bridge IP address
 DEFAULT_BRIDGE_IP = "192.168.49.91"
@@ -42,32 +44,53 @@ def parse_args():
 
 def main():
     args = parse_args()
-    
-    # Create controller and connect
+
+    # One tuple for both the summary line and the control calls
+    zones = tuple(args.zones)
+
+    # Determine the brightness level based on command
+    if args.command == 'on':
+        level = 100.0
+    elif args.command == 'off':
+        level = 0.0
+    elif args.command == 'half':
+        level = 50.0
+    elif args.command == 'set':
+        level = max(0.0, min(100.0, args.level))
+
+    # Print summary
+    zone_str = ", ".join(map(str, zones))
+    print(f"Controlling zones: {zone_str}")
+
+    # If the daemon is running, its warm connection skips the whole
+    # TCP + telnet login handshake for this one-shot invocation. The
+    # daemon sends per-zone anyway, so sequential pacing is honored by
+    # sleeping the requested delay between its calls
+    delay = args.delay if args.mode == 'sequential' else 0.0
+    reply = send_via_daemon(args.ip, f"SET {zones[0]} {level}")
+    if reply is not None:
+        failed = not reply.startswith("OK")
+        for zone_id in zones[1:]:
+            if delay > 0:
+                time.sleep(delay)
+            reply = send_via_daemon(args.ip, f"SET {zone_id} {level}")
+            if reply is None or not reply.startswith("OK"):
+                failed = True
+        if not failed:
+            return 0
+        print("Daemon error - falling back to a direct connection")
+
+    # No daemon - fall back to a direct connection
     with LutronController(args.ip) as controller:
         if not controller.connected:
             print("Failed to connect to the bridge")
             return 1
-        
-        # Determine the brightness level based on command
-        if args.command == 'on':
-            level = 100.0
-        elif args.command == 'off':
-            level = 0.0
-        elif args.command == 'half':
-            level = 50.0
-        elif args.command == 'set':
-            level = args.level
-        
-        # Print summary
-        zone_str = ", ".join(str(z) for z in args.zones)
-        print(f"Controlling zones: {zone_str}")
-        
+
         # Use the appropriate control method based on mode
         if args.mode == 'sequential':
-            controller.set_lights_sequential(args.zones, level, args.delay)
+            controller.set_lights_sequential(zones, level, args.delay)
         else:  # batch mode
-            controller.set_lights_batch(args.zones, level)
+            controller.set_lights_batch(zones, level)
         
         return 0
 
@@ -2,10 +2,39 @@
 import argparse
 import json
 import sys
+from collections import defaultdict
+
+# Optional: ijson streams just the Zones array out of the report instead
+# of materializing every unrelated node (devices, timeclock, ...)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: orjson parses a full report several times faster than the
+# stdlib when we do have to load the whole thing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Hardcoded bridge IP address
 DEFAULT_BRIDGE_IP = "192.168.49.91"
 
+def load_zones(report_path):
+    """Extract the Zones list from an integration report JSON file"""
+    if ijson is not None:
+        with open(report_path, 'rb') as f:
+            return list(ijson.items(f, 'LIPIdList.Zones.item'))
+
+    if orjson is not None:
+        with open(report_path, 'rb') as f:
+            report = orjson.loads(f.read())
+    else:
+        with open(report_path, 'r') as f:
+            report = json.load(f)
+    return report.get('LIPIdList', {}).get('Zones', [])
+
 def parse_args():
     parser = argparse.ArgumentParser(description='List zones from Lutron integration report')
     parser.add_argument('--report', '-r', required=True, help='Path to integration report JSON file')
@@ -18,25 +47,20 @@ def main():
     args = parse_args()
     
     try:
-        # Load the integration report
-        with open(args.report, 'r') as f:
-            report = json.load(f)
-        
-        # Extract zones
-        zones = report.get('LIPIdList', {}).get('Zones', [])
-        
-        # Organize zones by areas
-        zones_by_area = {}
-        
+        # Load just the zones from the integration report
+        zones = load_zones(args.report)
+
+        # Organize zones by areas; defaultdict saves the membership
+        # check (two hash lookups) per zone
+        zones_by_area = defaultdict(list)
+
+        # Plain (id, name) tuples: the listing only needs the two
+        # fields, and a tuple is far lighter than a dict per zone
         for zone in zones:
             area_name = zone.get('Area', {}).get('Name', 'Unknown Area')
-            if area_name not in zones_by_area:
-                zones_by_area[area_name] = []
-            
-            zones_by_area[area_name].append({
-                'id': zone.get('ID', 'Unknown'),
-                'name': zone.get('Name', 'Unknown'),
-            })
+            zones_by_area[area_name].append(
+                (zone.get('ID', 'Unknown'), zone.get('Name', 'Unknown'))
+            )
         
         # Filter by area if specified
         if args.area:
@@ -54,24 +78,29 @@ def main():
                 print("No zones found in the integration report")
             return 1
         
-        print("\nLutron Caseta Zones by Area:\n")
-        print(f"Bridge IP: {args.ip}\n")
-        
+        # Build the whole listing in memory and write it once, instead
+        # of a flushed print per zone/header/separator
+        out = []
+        out.append("\nLutron Caseta Zones by Area:\n\n")
+        out.append(f"Bridge IP: {args.ip}\n\n")
+
         for area_name, zone_list in sorted(zones_by_area.items()):
-            print(f"Area: {area_name}")
-            print("-" * (len(area_name) + 6))
-            
-            for zone in sorted(zone_list, key=lambda z: z['id']):
-                print(f"  Zone {zone['id']:>2}: {zone['name']}")
-            
-            print()
-        
+            out.append(f"Area: {area_name}\n")
+            out.append("-" * (len(area_name) + 6) + "\n")
+
+            for zone_id, zone_name in sorted(zone_list):
+                out.append(f"  Zone {zone_id:>2}: {zone_name}\n")
+
+            out.append("\n")
+
+        sys.stdout.write(''.join(out))
         return 0
         
     except FileNotFoundError:
         print(f"Error: Report file '{args.report}' not found.")
         return 1
-    except json.JSONDecodeError:
+    except ValueError:
+        # json.JSONDecodeError and ijson's parse errors both land here
         print(f"Error: Report file '{args.report}' is not valid JSON.")
         return 1
     except Exception as e:
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import argparse
 import sys
+from src.lutron_daemon import send_via_daemon
 from src.lutron_quick import LutronQuick
 
 # Hardcoded bridge IP address
@@ -31,26 +32,35 @@ def parse_args():
 
 def main():
     args = parse_args()
-    
-    # Create controller instance
+
+    if args.command == 'on':
+        print(f"Turning zone {args.zone} ON")
+        level = 100.0
+    elif args.command == 'off':
+        print(f"Turning zone {args.zone} OFF")
+        level = 0.0
+    else:  # set
+        level = max(0.0, min(100.0, args.level))
+        print(f"Setting zone {args.zone} to {level}%")
+
+    # A running daemon already holds a logged-in connection; the whole
+    # invocation is then one Unix-socket round trip
+    reply = send_via_daemon(args.ip, f"SET {args.zone} {level}")
+    if reply is not None:
+        if reply.startswith("OK"):
+            return 0
+        print(f"Daemon error: {reply}")
+        return 1
+
+    # No daemon - connect directly
     controller = LutronQuick(args.ip)
-    
+
     if not controller.connect():
         print("Failed to connect to the bridge")
         return 1
-    
+
     try:
-        if args.command == 'on':
-            print(f"Turning zone {args.zone} ON")
-            controller.set_light(args.zone, 100.0)
-        elif args.command == 'off':
-            print(f"Turning zone {args.zone} OFF")
-            controller.set_light(args.zone, 0.0)
-        elif args.command == 'set':
-            level = max(0.0, min(100.0, args.level))
-            print(f"Setting zone {args.zone} to {level}%")
-            controller.set_light(args.zone, level)
-        
+        controller.set_light(args.zone, level)
         return 0
     except Exception as e:
         print(f"Error: {e}")
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Lutron Async - asyncio client for the Lutron bridge
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from src.lutron_events import ZoneState, _LEVEL_CACHE
+from src.lutron_quick import (
+    LOGIN_PROMPT, PASSWORD_PROMPT, GNET_PROMPT, CRLF,
+    LOGIN_USER, LOGIN_PASSWORD,
+)
+
+class AsyncLutronQuick:
+    """
+    Asyncio counterpart of LutronQuick speaking the same GNET protocol.
+
+    StreamReader.readuntil scans for the prompt incrementally in C (no
+    rescans, no Python-level accumulation), and one event loop can keep
+    several bridges - or several in-flight commands on one bridge -
+    moving without threads or blocking recv calls.
+    """
+
+    def __init__(self, host, port=23, timeout=3, pipelined=False):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        # Pipelined mode: a background task owns all prompt reads and
+        # completes one queued Future per prompt, so overlapping
+        # send_command calls (asyncio.gather) interleave correctly
+        # instead of racing on the reader. Leave it off for
+        # AsyncLutronMonitor, which reads the event stream itself.
+        self.pipelined = pipelined
+        self._pending = deque()  # Futures awaiting a prompt, in send order
+        self._reader_task = None
+
+    async def connect(self):
+        """Connect and log in to the bridge."""
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+
+            # asyncio stream transports already disable Nagle by default
+
+            await self._read_until(LOGIN_PROMPT)
+            self.writer.write(LOGIN_USER)
+            await self._read_until(PASSWORD_PROMPT)
+            self.writer.write(LOGIN_PASSWORD)
+            await self._read_until(GNET_PROMPT)
+
+            if self.pipelined:
+                self._reader_task = asyncio.create_task(self._reader_loop())
+            return True
+
+        except Exception as e:
+            print(f"Connection error: {e}")
+            await self.close()
+            return False
+
+    async def _reader_loop(self):
+        """Complete pending futures with responses, one per prompt read."""
+        try:
+            while True:
+                response = await self.reader.readuntil(GNET_PROMPT)
+                if self._pending:
+                    future = self._pending.popleft()
+                    if not future.done():
+                        future.set_result(
+                            response.decode('utf-8', errors='replace'))
+        except (asyncio.IncompleteReadError, asyncio.CancelledError,
+                OSError) as e:
+            # Fail whatever is still in flight so awaiters don't hang
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError(f"Connection lost: {e}"))
+                    # Suppress "exception never retrieved" if nobody awaits
+                    future.exception()
+
+    async def _read_until(self, target):
+        """Read until target appears, bounded by the client timeout."""
+        return await asyncio.wait_for(self.reader.readuntil(target), self.timeout)
+
+    async def _send(self, command):
+        """Send one CRLF-terminated command line."""
+        self.writer.write(command.encode() + CRLF)
+        await self.writer.drain()
+
+    async def send_command(self, command):
+        """Send a command and return its decoded response, or None."""
+        if not self.writer:
+            print("Not connected")
+            return None
+
+        try:
+            if self._reader_task is not None:
+                # Queue the future before writing so the reader matches
+                # prompts to commands in send order
+                future = asyncio.get_running_loop().create_future()
+                self._pending.append(future)
+                await self._send(command)
+                return await asyncio.wait_for(future, self.timeout)
+
+            await self._send(command)
+            response = await self._read_until(GNET_PROMPT)
+            return response.decode('utf-8', errors='replace')
+        except Exception as e:
+            print(f"Command error: {e}")
+            return None
+
+    async def send_many(self, commands):
+        """
+        Send several commands pipelined and collect their responses.
+
+        All writes go out back-to-back before the first prompt is
+        awaited, so N commands cost one round trip instead of N.
+        Returns the list of decoded responses, or None on error.
+        """
+        if not self.writer:
+            print("Not connected")
+            return None
+        if not commands:
+            return []
+
+        try:
+            if self._reader_task is not None:
+                loop = asyncio.get_running_loop()
+                futures = [loop.create_future() for _ in commands]
+                self._pending.extend(futures)
+                self.writer.write(
+                    b"".join(command.encode() + CRLF for command in commands)
+                )
+                await self.writer.drain()
+                return await asyncio.wait_for(
+                    asyncio.gather(*futures), self.timeout)
+
+            self.writer.write(
+                b"".join(command.encode() + CRLF for command in commands)
+            )
+            await self.writer.drain()
+
+            responses = []
+            for _ in commands:
+                response = await self._read_until(GNET_PROMPT)
+                responses.append(response.decode('utf-8', errors='replace'))
+            return responses
+        except Exception as e:
+            print(f"Command error: {e}")
+            return None
+
+    async def set_light(self, zone_id, level):
+        """Set a light zone to a specific level."""
+        level = max(0.0, min(100.0, level))
+        response = await self.send_command(f"#OUTPUT,{zone_id},1,{level:.2f}")
+
+        if response is None:
+            return False
+        if "ERROR" in response:
+            print(f"Command error: {response}")
+            return False
+        return True
+
+    async def set_lights_batch(self, zone_ids, level):
+        """Set several zones to the same level with one pipelined write."""
+        level = max(0.0, min(100.0, level))
+
+        responses = await self.send_many(
+            [f"#OUTPUT,{zone_id},1,{level:.2f}" for zone_id in zone_ids]
+        )
+        if responses is None:
+            return False
+
+        for response in responses:
+            if "ERROR" in response:
+                print(f"Command error: {response}")
+                return False
+
+        return True
+
+    async def close(self):
+        """Close the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+            self.writer = None
+            self.reader = None
+
+class AsyncLutronMonitor:
+    """
+    Asyncio counterpart of lutron_events.LutronMonitor.
+
+    readuntil(CRLF) replaces the whole buffer-and-cursor machinery: the
+    stream reader frames lines incrementally in C, and the event loop
+    can run monitoring alongside other bridge work in the same thread.
+    """
+
+    def __init__(self, host, port=23, timeout=60):
+        self.quick = AsyncLutronQuick(host, port, timeout)
+        self.callbacks = []  # each called with (kind, line) per event
+        self.zones = {}      # zone_id -> ZoneState, updated per report
+        self._handlers = {
+            "~OUTPUT": self._handle_output,
+            "~DEVICE": self._handle_device,
+            "~ERROR": self._handle_error,
+        }
+
+    async def connect(self):
+        """Connect, log in, and enable monitoring mode."""
+        if not await self.quick.connect():
+            return False
+        response = await self.quick.send_command("#MONITORING,255,1")
+        return response is not None
+
+    def add_callback(self, callback):
+        """Register a callback invoked as callback(kind, line)."""
+        self.callbacks.append(callback)
+
+    async def run(self):
+        """Dispatch events until the connection closes or we're cancelled."""
+        reader = self.quick.reader
+        if reader is None:
+            print("Not connected")
+            return
+
+        while True:
+            try:
+                raw = await reader.readuntil(CRLF)
+            except asyncio.IncompleteReadError:
+                print("Connection closed by bridge")
+                return
+            self._process_line(raw[:-2])
+
+    async def close(self):
+        """Disable monitoring and close the connection."""
+        if self.quick.writer:
+            try:
+                await self.quick._send("#MONITORING,255,0")
+            except OSError:
+                pass
+        await self.quick.close()
+
+    def _process_line(self, raw):
+        """Decode and dispatch one event line (same rules as the sync monitor)."""
+        if not raw or raw.startswith(b"GNET>"):
+            return
+
+        try:
+            line = raw.decode('ascii')
+        except UnicodeDecodeError:
+            line = raw.decode('utf-8', errors='replace')
+
+        parts = line.split(',', 3)
+        handler = self._handlers.get(parts[0])
+        if handler is not None:
+            handler(line, parts)
+        else:
+            self._dispatch("EVENT", line)
+
+    def _handle_output(self, line, parts):
+        if len(parts) == 4 and parts[2] == '1':
+            level = _LEVEL_CACHE.get(parts[3])
+            try:
+                zone_id = int(parts[1])
+                if level is None:
+                    level = float(parts[3])
+            except ValueError:
+                pass
+            else:
+                state = self.zones.get(zone_id)
+                if state is None:
+                    self.zones[zone_id] = ZoneState(
+                        zone_id, level, time.monotonic())
+                else:
+                    state.level = level
+                    state.updated = time.monotonic()
+        self._dispatch("OUTPUT", line)
+
+    def _handle_device(self, line, parts):
+        self._dispatch("DEVICE", line)
+
+    def _handle_error(self, line, parts):
+        print(f"Bridge error: {line}")
+        self._dispatch("ERROR", line)
+
+    def _dispatch(self, kind, line):
+        callbacks = self.callbacks
+        if callbacks:
+            for callback in callbacks:
+                callback(kind, line)
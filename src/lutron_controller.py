@@ -3,60 +3,199 @@
 Lutron Controller - High-level control functions for Lutron lights
 """
 
-import threading
+import select
 import time
-from src.lutron_quick import LutronQuick
+from src.lutron_quick import LutronQuick, GNET_PROMPT
 from src.lutron_zones import Zone
 
+class RateLimiter:
+    """
+    Token-bucket limiter for per-command pacing.
+
+    A burst of up to `capacity` commands goes out immediately; after
+    that, commands are throttled to `refill_rate` per second. Unlike a
+    fixed inter-command sleep, no idle time is inserted while the
+    bucket still has tokens.
+    """
+
+    def __init__(self, capacity=10, refill_rate=20.0):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def acquire(self):
+        """Take one token, sleeping only if the bucket is empty"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+        if self.tokens < 1.0:
+            # Sleep just long enough for one token to refill
+            time.sleep((1.0 - self.tokens) / self.refill_rate)
+            self.tokens = 1.0
+            self.last_refill = time.monotonic()
+
+        self.tokens -= 1.0
+
 class LutronController:
     """Advanced controller with batch and sequential operations for Lutron lights"""
-    
+
+    # Flush a pending batch once it collects this many commands
+    MAX_BATCH = 50
+
     def __init__(self, host, port=23, timeout=3):
         """Initialize the controller with connection parameters"""
         self.quick = LutronQuick(host, port, timeout)
         self.connected = False
-    
+        self._pending = None  # buffered commands while a batch is open
+        self._pending_levels = None  # their zone->level targets, unconfirmed
+        self._limiter = RateLimiter()
+        # Last level sent per zone; repeat sends to the same level are
+        # skipped. Only levels this controller set are tracked - use
+        # invalidate_cache after external changes (wall switch, app)
+        self._last_level = {}
+
     def connect(self):
         """Connect to the Lutron bridge"""
         self.connected = self.quick.connect()
         return self.connected
-    
+
     def close(self):
         """Close the connection"""
         if self.connected:
+            self.flush()
             self.quick.close()
             self.connected = False
-    
+
+    def begin_batch(self):
+        """
+        Start coalescing set_light calls into one pipelined write.
+
+        Until flush() is called, set_light only buffers its command, so
+        tight loops issuing many commands pay a single send instead of a
+        round trip each. close() flushes automatically.
+        """
+        if self._pending is None:
+            self._pending = []
+            self._pending_levels = {}
+
+    def flush(self):
+        """Send any buffered commands as one pipelined write"""
+        commands = self._pending
+        levels = self._pending_levels
+        self._pending = None
+        self._pending_levels = None
+
+        if not commands:
+            return True
+
+        # Levels become "known applied" only once the batch actually
+        # lands; a failed flush must not poison the skip cache
+        if self.quick.send_commands(commands) is None:
+            return False
+        self._last_level.update(levels)
+        return True
+
     def set_light(self, zone_id, level):
         """Control a single light zone"""
         if not self.connected:
             raise RuntimeError("Not connected to bridge")
-            
-        # If zone_id is a Zone object, extract just the ID
-        if isinstance(zone_id, Zone):
-            zone_id = zone_id.id
-            
-        return self.quick.set_light(zone_id, level)
-    
-    def _set_light_thread(self, zone_id, level):
-        """Helper function for threading - controls a single light"""
+
         # If zone_id is a Zone object, extract just the ID
         if isinstance(zone_id, Zone):
             zone_id = zone_id.id
-            
-        self.quick.set_light(zone_id, level)
+
+        level = max(0.0, min(100.0, level))
+
+        # Already at this level (as far as we know) - nothing to send
+        if self._last_level.get(zone_id) == level:
+            return True
+
+        # While a batch is open, just buffer the command; the level is
+        # held aside and only enters _last_level when flush() succeeds
+        if self._pending is not None:
+            if self._pending_levels.get(zone_id) == level:
+                return True
+            self._pending.append(f"#OUTPUT,{zone_id},1,{level:.2f}")
+            self._pending_levels[zone_id] = level
+            if len(self._pending) >= self.MAX_BATCH:
+                return self.flush()
+            return True
+
+        # Bound the sustained per-command rate without penalizing bursts
+        self._limiter.acquire()
+        result = self.quick.set_light(zone_id, level)
+        if result:
+            self._last_level[zone_id] = level
+        return result
+
+    def pace(self, seconds):
+        """
+        Pause like time.sleep, but keep watching the socket.
+
+        A plain sleep leaves the process deaf: bytes the bridge pushes
+        during the pause (including error responses) sit unread until
+        the next command. pace() waits in select instead, draining
+        anything that arrives, and raises if the connection drops so a
+        show aborts instead of streaming into a dead socket.
+        """
+        sock = self.quick.socket
+        if sock is None:
+            time.sleep(seconds)
+            return
+
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            readable, _, _ = select.select([sock], [], [], remaining)
+            if not readable:
+                continue
+
+            data = sock.recv(4096)
+            if not data:
+                self.connected = False
+                raise RuntimeError("Connection closed by bridge")
+            if b"ERROR" in data:
+                print(f"Bridge error during pause: "
+                      f"{data.decode('utf-8', errors='replace').strip()}")
+
+            # Keep the client's bookkeeping intact: prompts owed by an
+            # earlier no-wait send are settled here (as drain_responses
+            # would), and anything else stays buffered for the next
+            # read instead of being thrown away
+            buffer = self.quick._buffer
+            buffer.extend(data)
+            while self.quick._pending_prompts > 0:
+                idx = buffer.find(GNET_PROMPT)
+                if idx == -1:
+                    break
+                del buffer[:idx + len(GNET_PROMPT)]
+                self.quick._pending_prompts -= 1
+
+    def invalidate_cache(self, zone_id=None):
+        """Forget cached levels so the next command is sent for real"""
+        if zone_id is None:
+            self._last_level.clear()
+        else:
+            self._last_level.pop(zone_id, None)
     
-    def set_lights_sequential(self, zones, level, delay=0.5, verbose=True):
+    def set_lights_sequential(self, zones, level, delay=0.0, verbose=True):
         """
         Control multiple lights sequentially
-        
+
         Args:
             zones: List of zones. Each zone can be either:
                 - An integer (zone_id)
                 - A dict with 'id' and 'name' keys
                 - A Zone object
             level: Brightness level (0-100)
-            delay: Delay between commands in seconds
+            delay: Extra delay between commands in seconds (0 = no pacing;
+                each command already waits for the bridge's prompt)
             verbose: Whether to print status messages
         """
         if not self.connected:
@@ -66,7 +205,36 @@ class LutronController:
         
         if verbose:
             print(f"Setting {len(zones)} lights to {level}% (sequential mode, {delay}s delay)")
-        
+
+        # With no pacing requested, "sequential" only means the bridge
+        # applies the commands in order - which it does anyway for one
+        # pipelined write, so send the whole list in a single burst
+        if delay <= 0:
+            commands = []
+            zone_ids = []
+            for zone in zones:
+                if isinstance(zone, Zone):
+                    zone_id = zone.id
+                    zone_name = zone.name
+                elif isinstance(zone, dict):
+                    zone_id = zone['id']
+                    zone_name = zone.get('name', f"Zone {zone_id}")
+                else:
+                    zone_id = zone
+                    zone_name = f"Zone {zone_id}"
+
+                if verbose:
+                    print(f"  - Setting {zone_name} (Zone {zone_id}) to {level}%")
+                commands.append(f"#OUTPUT,{zone_id},1,{level:.2f}")
+                zone_ids.append(zone_id)
+
+            if self.quick.send_commands(commands) is None:
+                return False
+            # Keep the skip cache honest - these sends change real levels
+            for zone_id in zone_ids:
+                self._last_level[zone_id] = level
+            return True
+
         # Process each zone
         for zone in zones:
             # Extract zone_id and zone_name based on type
@@ -85,16 +253,34 @@ class LutronController:
                 if verbose:
                     print(f"  - Setting Zone {zone_id} to {level}%")
             
-            # Control this light
-            self.quick.set_light(zone_id, level)
-            
-            # Wait before next command
-            time.sleep(delay)
+            # Control this light; set_light already waits for the bridge's
+            # prompt, so extra pacing is only applied when asked for
+            if self.quick.set_light(zone_id, level):
+                self._last_level[zone_id] = level
+
+            if delay > 0:
+                time.sleep(delay)
     
+    def set_lights_ramp(self, zones, levels, delay=0.0, verbose=True):
+        """
+        Walk zones through several brightness levels in one call
+
+        Args:
+            zones: List of zones (Zone objects, dicts, or ints)
+            levels: Brightness levels (0-100) applied in order
+            delay: Extra delay between commands in seconds
+            verbose: Whether to print status messages
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to bridge")
+
+        for level in levels:
+            self.set_lights_sequential(zones, level, delay=delay, verbose=verbose)
+
     def set_lights_batch(self, zones, level, verbose=True):
         """
-        Control multiple lights simultaneously using threads
-        
+        Control multiple lights simultaneously with one pipelined write
+
         Args:
             zones: List of zones. Each zone can be either:
                 - An integer (zone_id)
@@ -105,48 +291,111 @@ class LutronController:
         """
         if not self.connected:
             raise RuntimeError("Not connected to bridge")
-            
+
         level = max(0.0, min(100.0, level))
-        
+
         if verbose:
             print(f"Setting {len(zones)} lights to {level}% (batch mode)")
-        
-        # Create a thread for each light
-        threads = []
-        
+
+        zone_ids = []
         for zone in zones:
             # Extract zone_id and zone_name based on type
             if isinstance(zone, Zone):
                 zone_id = zone.id
                 zone_name = zone.name
-                if verbose:
-                    print(f"  - Queuing {zone_name} (Zone {zone_id})")
             elif isinstance(zone, dict):
                 zone_id = zone['id']
                 zone_name = zone.get('name', f"Zone {zone_id}")
-                if verbose:
-                    print(f"  - Queuing {zone_name} (Zone {zone_id})")
             else:
                 zone_id = zone
-                if verbose:
-                    print(f"  - Queuing Zone {zone_id}")
-            
-            # Create thread for this light
-            thread = threading.Thread(
-                target=self._set_light_thread,
-                args=(zone_id, level)
-            )
-            threads.append(thread)
-        
-        # Start all threads with a small stagger
-        for thread in threads:
-            thread.start()
-            time.sleep(0.1)  # Small stagger to avoid flooding the bridge
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-            
+                zone_name = f"Zone {zone_id}"
+
+            # Skip zones already at the target level
+            if self._last_level.get(zone_id) == level:
+                continue
+
+            if verbose:
+                print(f"  - Queuing {zone_name} (Zone {zone_id})")
+
+            zone_ids.append(zone_id)
+
+        if not zone_ids:
+            return True
+
+        # All commands share the single telnet socket, so threads only ever
+        # serialized on it anyway - send them back-to-back in one write
+        result = self.quick.set_lights_batch(zone_ids, level)
+        if result:
+            for zone_id in zone_ids:
+                self._last_level[zone_id] = level
+        return result
+
+    def set_zone_levels(self, levels, verbose=True):
+        """
+        Set several zones to individual levels in one pipelined write
+
+        Args:
+            levels: Mapping of zone (Zone object or int id) to
+                brightness level (0-100)
+            verbose: Whether to print status messages
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to bridge")
+
+        resolved = {}
+        for zone, level in levels.items():
+            zone_id = zone.id if isinstance(zone, Zone) else zone
+            level = max(0.0, min(100.0, level))
+
+            # Skip zones already at their target level
+            if self._last_level.get(zone_id) == level:
+                continue
+            resolved[zone_id] = level
+
+        if not resolved:
+            return True
+
+        if verbose:
+            print(f"Setting {len(resolved)} lights to individual levels (batch mode)")
+
+        result = self.quick.set_zone_levels(resolved)
+        if result:
+            self._last_level.update(resolved)
+        return result
+
+    def set_lights_batch_async(self, zones, level):
+        """
+        Fire a batch without waiting for the bridge's acks.
+
+        Useful when a deliberate pause follows anyway: the sleep overlaps
+        the ack round trip. Call drain_responses() before the next
+        blocking operation to settle the outstanding prompts.
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected to bridge")
+
+        level = max(0.0, min(100.0, level))
+
+        commands = []
+        for zone in zones:
+            if isinstance(zone, Zone):
+                zone_id = zone.id
+            elif isinstance(zone, dict):
+                zone_id = zone['id']
+            else:
+                zone_id = zone
+            commands.append(f"#OUTPUT,{zone_id},1,{level:.2f}")
+            # The outcome is unconfirmed until the acks drain, so the
+            # cached level can't be trusted either way - drop it rather
+            # than let a later set_light skip a needed send
+            self._last_level.pop(zone_id, None)
+
+        return self.quick.send_commands_nowait(commands)
+
+    def drain_responses(self):
+        """Consume acks owed by earlier set_lights_batch_async calls"""
+        return self.quick.drain_responses()
+
     def __enter__(self):
         """Support for with statement"""
         self.connect()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Lutron Daemon - Hold a persistent bridge connection for one-shot commands
+
+Every CLI invocation normally pays a fresh TCP connect plus the telnet
+login handshake for a single command. Running this daemon keeps one
+authenticated session open per bridge and lets clients forward commands
+over a local Unix socket instead.
+
+Start it directly (python3 src/lutron_daemon.py) or as a module
+(python3 -m src.lutron_daemon) from the repo root.
+
+Protocol: one request per line, a reply line per request.
+    SET <zone_id> <level>   -> "OK" or "ERR <reason>"
+    #... / ?...             -> raw command forwarded to the bridge
+"""
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+# Add parent directory to path to allow imports when run directly
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if parent_dir not in sys.path:
+    sys.path.append(parent_dir)
+
+from src.lutron_quick import LutronQuick
+
+# Hardcoded bridge IP address
+DEFAULT_BRIDGE_IP = "192.168.49.91"
+
+# Close the telnet session after this much inactivity (seconds)
+IDLE_TIMEOUT = 30
+
+def socket_path(ip):
+    """Unix socket path used for a given bridge IP"""
+    return f"/tmp/lutron-{ip}.sock"
+
+def send_via_daemon(ip, command, timeout=5):
+    """
+    Send one command line through a running daemon.
+
+    Returns the reply string, or None when no daemon is listening so
+    callers can fall back to a direct bridge connection.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        client.connect(socket_path(ip))
+        client.sendall(command.encode() + b"\n")
+        reply = client.recv(4096)
+        return reply.decode('utf-8', errors='replace').strip()
+    except OSError:
+        return None
+    finally:
+        client.close()
+
+class LutronDaemon:
+    """Owns one authenticated telnet session and serves local clients"""
+
+    def __init__(self, ip, port=23):
+        self.ip = ip
+        self.port = port
+        self.quick = None
+        self.last_used = 0.0
+        self.lock = threading.Lock()
+
+    def _ensure_connected(self):
+        """Open the bridge connection on demand"""
+        if self.quick is None:
+            quick = LutronQuick(self.ip, self.port)
+            if not quick.connect():
+                return False
+            self.quick = quick
+        return True
+
+    def _idle_sweep(self):
+        """Close the bridge connection when no client has used it recently"""
+        while True:
+            time.sleep(IDLE_TIMEOUT)
+            with self.lock:
+                if self.quick and time.time() - self.last_used > IDLE_TIMEOUT:
+                    print("Closing idle bridge connection")
+                    self.quick.close()
+                    self.quick = None
+
+    def handle_line(self, line):
+        """Process one client request and return the reply string"""
+        with self.lock:
+            if not self._ensure_connected():
+                return "ERR connect failed"
+            self.last_used = time.time()
+
+            parts = line.split()
+            if parts and parts[0].upper() == "SET" and len(parts) == 3:
+                try:
+                    level = float(parts[2])
+                except ValueError:
+                    return f"ERR bad level: {parts[2]}"
+                ok = self.quick.set_light(parts[1], level)
+                return "OK" if ok else "ERR command failed"
+
+            if line.startswith(("#", "?")):
+                result = self.quick.send_command(line)
+                return "OK" if result is not None else "ERR command failed"
+
+            return f"ERR unknown command: {line}"
+
+    def serve(self):
+        """Accept clients on the Unix socket until interrupted"""
+        path = socket_path(self.ip)
+        if os.path.exists(path):
+            os.unlink(path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(5)
+
+        # Reap the bridge connection in the background when idle
+        sweeper = threading.Thread(target=self._idle_sweep, daemon=True)
+        sweeper.start()
+
+        print(f"Listening on {path}")
+        try:
+            while True:
+                conn, _ = server.accept()
+                try:
+                    data = conn.recv(4096)
+                    if data:
+                        line = data.decode('utf-8', errors='replace').strip()
+                        reply = self.handle_line(line)
+                        conn.sendall(reply.encode() + b"\n")
+                finally:
+                    conn.close()
+        except KeyboardInterrupt:
+            print("\nDaemon stopped by user")
+        finally:
+            server.close()
+            if os.path.exists(path):
+                os.unlink(path)
+            with self.lock:
+                if self.quick:
+                    self.quick.close()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the Lutron connection daemon')
+    parser.add_argument('--ip', '-i', default=DEFAULT_BRIDGE_IP,
+                        help=f'IP address of the Lutron bridge (default: {DEFAULT_BRIDGE_IP})')
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    daemon = LutronDaemon(args.ip)
+    daemon.serve()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Lutron Events - real-time event monitoring for the Lutron bridge
+"""
+
+import selectors
+import time
+
+from src.lutron_quick import LutronQuick, CRLF, RECV_CHUNK
+
+# Reported levels are almost always whole percentages; map the
+# "75.00" form the bridge emits (and the bare "75" form) straight to
+# floats so the common case is a dict hit instead of C float parsing
+_LEVEL_CACHE = {f"{i}.00": float(i) for i in range(101)}
+_LEVEL_CACHE.update((str(i), float(i)) for i in range(101))
+
+class ZoneState:
+    """
+    Latest reported state for one zone.
+
+    __slots__ keeps a populated bridge's worth of these at a fixed few
+    dozen bytes each instead of a per-record dict, and makes .level a
+    C-level slot fetch on the event hot path. Instances are mutated in
+    place, so steady-state monitoring allocates nothing per event.
+    """
+
+    __slots__ = ('zone_id', 'level', 'updated')
+
+    def __init__(self, zone_id, level, updated):
+        self.zone_id = zone_id
+        self.level = level
+        self.updated = updated
+
+class LutronMonitor:
+    """
+    Consumes the bridge's ~event stream after enabling monitoring mode.
+
+    Connection setup and login are delegated to LutronQuick so there is
+    exactly one implementation of the GNET handshake in the tree; this
+    class owns only the event loop, line framing, and dispatch.
+    """
+
+    def __init__(self, host, port=23, timeout=60):
+        self.quick = LutronQuick(host, port, timeout)
+        self.callbacks = []  # each called with (kind, line) per event
+        self.zones = {}      # zone_id -> ZoneState, updated per report
+        self.buffer = bytearray()
+        self._buf_offset = 0  # start of the first unconsumed byte
+        # Reusable recv scratch so the event loop never allocates a
+        # fresh bytes object per read
+        self._recv_scratch = bytearray(RECV_CHUNK)
+        self._recv_mv = memoryview(self._recv_scratch)
+        self.running = False
+        # First-field dispatch table: one hash lookup per event instead
+        # of a prefix comparison chain, and new event types can be
+        # handled without touching the hot path
+        self._handlers = {
+            "~OUTPUT": self._handle_output,
+            "~DEVICE": self._handle_device,
+            "~ERROR": self._handle_error,
+        }
+
+    def connect(self):
+        """Connect, log in, and enable monitoring mode."""
+        if not self.quick.connect():
+            return False
+
+        response = self.quick.send_command("#MONITORING,255,1")
+        return response is not None
+
+    def add_callback(self, callback):
+        """Register a callback invoked as callback(kind, line)."""
+        self.callbacks.append(callback)
+
+    def run(self):
+        """Block dispatching events until stop() or connection loss."""
+        sock = self.quick.socket
+        if sock is None:
+            print("Not connected")
+            return
+
+        # Block in the kernel until the bridge sends something; the
+        # selector maps to epoll/kqueue rather than select's fd-set
+        # scan, and its short timeout only exists so stop() is honored
+        sock.settimeout(None)
+        self.running = True
+
+        # Events sent in the same TCP segment as the monitoring ack were
+        # read past the prompt into LutronQuick's buffer by connect();
+        # claim and dispatch them before waiting for fresh data, or the
+        # first reports after enabling monitoring are silently lost
+        leftover = self.quick._buffer
+        if leftover:
+            self.buffer.extend(leftover)
+            leftover.clear()
+            self._process_buffer()
+
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        try:
+            while self.running:
+                if not selector.select(1.0):
+                    continue
+
+                received = sock.recv_into(self._recv_scratch)
+                if not received:
+                    print("Connection closed by bridge")
+                    break
+
+                self.buffer.extend(self._recv_mv[:received])
+                self._process_buffer()
+        finally:
+            selector.close()
+
+    def stop(self):
+        """Ask run() to return after the current select pass."""
+        self.running = False
+
+    def close(self):
+        """Disable monitoring and close the connection."""
+        if self.quick.socket:
+            self.quick.socket.settimeout(self.quick.timeout)
+            try:
+                self.quick.socket.sendall(b"#MONITORING,255,0" + CRLF)
+            except OSError:
+                pass
+        self.quick.close()
+
+    def _process_buffer(self):
+        """
+        Extract complete CRLF-terminated lines from the buffer.
+
+        The whole ready region - everything up to the last complete
+        line boundary - is decoded in one call, so a burst of
+        back-to-back events pays for a single C-level decode, then
+        str.split hands out the lines. Consumed bytes are only
+        compacted away once they pile up.
+        """
+        buffer = self.buffer
+        offset = self._buf_offset
+
+        end = buffer.rfind(b'\r\n', offset)
+        if end >= 0:
+            # GNET is ASCII-only; anything else is corruption, not
+            # text, so it surfaces as replacement characters
+            text = bytes(buffer[offset:end]).decode('ascii', 'replace')
+            offset = end + 2
+            for line in text.split('\r\n'):
+                if line:
+                    self._process_line(line)
+
+        # Drop consumed bytes once they dominate the buffer
+        if offset > 65536 or offset > len(buffer) // 2:
+            del buffer[:offset]
+            offset = 0
+
+        self._buf_offset = offset
+
+    def _process_line(self, line):
+        """Dispatch one decoded event line."""
+        # Prompt echoes arrive after every command response
+        if line.startswith("GNET>"):
+            return
+
+        # maxsplit stops the scan after the fields any handler uses
+        parts = line.split(',', 3)
+        handler = self._handlers.get(parts[0])
+        if handler is not None:
+            handler(line, parts)
+        else:
+            self._dispatch("EVENT", line)
+
+    def _handle_output(self, line, parts):
+        # ~OUTPUT,<zone>,<action>,<level>; action 1 is a level report
+        if len(parts) == 4 and parts[2] == '1':
+            level = _LEVEL_CACHE.get(parts[3])
+            try:
+                zone_id = int(parts[1])
+                if level is None:
+                    level = float(parts[3])
+            except ValueError:
+                pass
+            else:
+                state = self.zones.get(zone_id)
+                if state is None:
+                    self.zones[zone_id] = ZoneState(
+                        zone_id, level, time.monotonic())
+                else:
+                    state.level = level
+                    state.updated = time.monotonic()
+        self._dispatch("OUTPUT", line)
+
+    def _handle_device(self, line, parts):
+        self._dispatch("DEVICE", line)
+
+    def _handle_error(self, line, parts):
+        print(f"Bridge error: {line}")
+        self._dispatch("ERROR", line)
+
+    def _dispatch(self, kind, line):
+        # Snapshot the attribute once; skip iteration setup entirely
+        # when nobody registered a callback
+        callbacks = self.callbacks
+        if callbacks:
+            for callback in callbacks:
+                callback(kind, line)
@@ -1,141 +1,523 @@
 #!/usr/bin/env python3
 
+import os
 import socket
 import time
 import sys
 import json
 import argparse
+from functools import lru_cache
+
+# GNET protocol constants - the prompts and terminator never change, so
+# build the byte strings once at import
+LOGIN_PROMPT = b"login: "
+PASSWORD_PROMPT = b"password: "
+GNET_PROMPT = b"GNET> "
+CRLF = b"\r\n"
+
+# Fixed credentials the bridge firmware ships with, pre-encoded with
+# the terminator so login writes reuse one bytes object
+LOGIN_USER = b"lutron" + CRLF
+LOGIN_PASSWORD = b"integration" + CRLF
+
+# Per-read request size. Query dumps on a populated bridge run to tens
+# of KB, so 4K reads would quadruple the syscall count for no benefit
+RECV_CHUNK = 16384
+
+@lru_cache(maxsize=256)
+def _encode_cmd(command):
+    """Encode one CRLF-terminated command line, caching repeats.
+
+    The command vocabulary is tiny and repetitive (the same #OUTPUT
+    strings recur across shows, queries are constants), so encoding
+    each distinct command once covers nearly every send.
+    """
+    return command.encode() + CRLF
 
 class LutronQuick:
-    """Simplified Lutron Telnet controller with quick commands."""
-    
-    def __init__(self, host, port=23, timeout=3):
+    """
+    Simplified Lutron Telnet controller with quick commands.
+
+    The bridge's GNET protocol is plain CR/LF-terminated ASCII - there is
+    no telnet IAC option negotiation - so this deliberately works on a raw
+    socket instead of a telnet library.
+    """
+
+    def __init__(self, host, port=23, timeout=3,
+                 recv_buffer=262144, send_buffer=65536,
+                 min_send_interval=0.0):
         self.host = host
         self.port = port
         self.timeout = timeout
+        # Optional floor on the gap between sends, for firmware that
+        # rate-limits; 0 means commands go out as fast as prompts allow
+        self.min_send_interval = min_send_interval
+        self._last_send = 0.0
+        # Kernel socket buffer sizes requested at connect time; the OS
+        # may cap them silently
+        self.recv_buffer = recv_buffer
+        self.send_buffer = send_buffer
         self.socket = None
+        # Reusable receive scratch buffer so reads don't allocate a fresh
+        # bytes object per recv call
+        self._recv_buf = bytearray(RECV_CHUNK)
+        self._recv_view = memoryview(self._recv_buf)
+        # Bytes received but not yet consumed; kept across reads so
+        # nothing after a prompt is ever thrown away
+        self._buffer = bytearray()
+        # Cached responses for read-only '?' queries: command -> (response, ts)
+        self._query_cache = {}
+        self._query_cache_loaded = False
+        # Prompts owed by no-wait sends, consumed by drain_responses
+        self._pending_prompts = 0
+        # Formatted #OUTPUT commands keyed by (zone_id, level); shows
+        # cycle a handful of discrete levels, so this stays tiny
+        self._cmd_cache = {}
+        # Per-zone command prefix, reused when the full command misses
+        self._cmd_prefix = {}
     
     def connect(self):
         """Connect to the Lutron bridge with a shorter timeout."""
+        # An unreachable host fails here once; retrying the staged path
+        # would just spend a second full timeout on the same failure
+        try:
+            self._open_socket()
+        except Exception as e:
+            print(f"Connection error: {e}")
+            self._drop_socket()
+            return False
+
+        # Type-ahead first: the bridge buffers input it hasn't prompted
+        # for yet, so both credentials can ride right behind the TCP
+        # handshake and only the final prompt is awaited - two round
+        # trips fewer than answering each prompt in turn
+        if self._login(staged=False):
+            return True
+
+        # Firmware that rejects type-ahead gets the prompt-by-prompt
+        # path, on a fresh socket since credentials already went out
+        try:
+            self._open_socket()
+        except Exception as e:
+            print(f"Connection error: {e}")
+            self._drop_socket()
+            return False
+
+        return self._login(staged=True)
+
+    def _open_socket(self):
+        """Create, connect, and tune the bridge socket."""
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.settimeout(self.timeout)
+
+        print(f"Connecting to {self.host}:{self.port}...")
+        self.socket.connect((self.host, self.port))
+
+        # Disable Nagle's algorithm - commands are tiny and interactive,
+        # so don't let the kernel hold them waiting for an ACK
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Let the kernel absorb response bursts without extra wakeups -
+        # the receive side is sized for a full pipelined batch of
+        # responses plus the monitoring chatter a long session can
+        # accumulate, the send side for a whole batch of commands.
+        # Some OSes reject or silently cap these, hence the guard
+        try:
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.recv_buffer)
+            self.socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer)
+        except OSError:
+            pass
+
+        # Suppress delayed ACKs so the bridge's next response isn't
+        # held back waiting for our ACK (Linux only)
+        if hasattr(socket, "TCP_QUICKACK"):
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+        # Long-held connections (the daemon's warm socket) should
+        # notice a silently dead bridge instead of hanging forever
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        # Probe after 30s idle, every 5s, give up after 3 misses - a
+        # dead bridge surfaces in under a minute rather than the
+        # kernel's two-hour default (Linux only)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+
+    def _drop_socket(self):
+        """Close the socket and discard any partial login chatter."""
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+        self._buffer.clear()
+
+    def _login(self, staged):
+        """One login attempt on the open socket, type-ahead or prompt-by-prompt."""
+        try:
+            if not staged:
+                # Both credentials in one write; wait only for GNET
+                self.socket.sendall(LOGIN_USER + LOGIN_PASSWORD)
+                data = self._read_with_timeout(GNET_PROMPT)
+                if not data or GNET_PROMPT not in data:
+                    print("Type-ahead login failed, retrying staged login")
+                    self._drop_socket()
+                    return False
+            else:
+                # Wait for login prompt
+                data = self._read_with_timeout(LOGIN_PROMPT)
+                if not data:
+                    print("Didn't receive login prompt")
+                    return False
+
+                # Send username (pre-encoded, no _send formatting)
+                self.socket.sendall(LOGIN_USER)
+
+                # Wait for password prompt
+                data = self._read_with_timeout(PASSWORD_PROMPT)
+                if not data:
+                    print("Didn't receive password prompt")
+                    return False
+
+                # Send password
+                self.socket.sendall(LOGIN_PASSWORD)
+
+                # Wait for prompt
+                data = self._read_with_timeout(GNET_PROMPT)
+                if not data:
+                    print("Didn't receive command prompt")
+                    return False
+
+            print("Connected successfully")
+            return True
+
+        except Exception as e:
+            print(f"Connection error: {e}")
+            self._drop_socket()
+            return False
+    
+    def connect_and_send(self, commands):
+        """
+        Connect and pipeline commands into the login exchange.
+
+        The bridge queues type-ahead input, so the commands ride in the
+        same write as the password and execute as soon as login
+        completes - one round trip covers authentication plus the whole
+        command list. Ideal for one-shot invocations (cron, CLI).
+        """
         try:
-            # Create socket with timeout
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(self.timeout)
-            
-            # Connect
-            print(f"Connecting to {self.host}:{self.port}...")
-            self.socket.connect((self.host, self.port))
-            
-            # Wait for login prompt
-            data = self._read_with_timeout(b"login: ")
-            if not data:
+            self._open_socket()
+
+            if not self._read_with_timeout(LOGIN_PROMPT):
                 print("Didn't receive login prompt")
                 return False
-                
-            # Send username
-            self._send("lutron")
-            
-            # Wait for password prompt
-            data = self._read_with_timeout(b"password: ")
-            if not data:
+
+            self.socket.sendall(LOGIN_USER)
+
+            if not self._read_with_timeout(PASSWORD_PROMPT):
                 print("Didn't receive password prompt")
                 return False
-                
-            # Send password
-            self._send("integration")
-            
-            # Wait for prompt
-            data = self._read_with_timeout(b"GNET> ")
-            if not data:
-                print("Didn't receive command prompt")
-                return False
-                
-            print("Connected successfully")
+
+            # Password and commands go out in one write
+            payload = LOGIN_PASSWORD + b"".join(
+                command.encode() + CRLF for command in commands
+            )
+            self.socket.sendall(payload)
+
+            # One prompt for login, then one per command
+            pending = 1 + len(commands)
+            while pending > 0:
+                response = self._read_with_timeout(GNET_PROMPT)
+                if not response:
+                    print("Didn't receive command prompt")
+                    return False
+                if b"ERROR" in response:
+                    print(f"Command error: {response.decode('utf-8', errors='replace')}")
+                    return False
+                pending -= response.count(GNET_PROMPT)
+
             return True
-            
+
         except Exception as e:
             print(f"Connection error: {e}")
-            if self.socket:
-                self.socket.close()
-                self.socket = None
+            self._drop_socket()
             return False
-    
+
     def _send(self, data):
         """Send a command to the bridge."""
         if self.socket:
             try:
-                self.socket.sendall(f"{data}\r\n".encode())
-                # Small delay after sending
-                time.sleep(0.1)
+                # No blind post-send delay: the prompt wait in
+                # _read_with_timeout already paces the protocol. Only
+                # sleep out the remainder of an explicitly configured
+                # inter-send floor
+                if self.min_send_interval > 0.0:
+                    wait = (self._last_send + self.min_send_interval
+                            - time.monotonic())
+                    if wait > 0:
+                        time.sleep(wait)
+                self.socket.sendall(_encode_cmd(data))
+                self._last_send = time.monotonic()
             except Exception as e:
                 print(f"Send error: {e}")
                 return False
             return True
         return False
     
+    def _send_many(self, commands):
+        """
+        Write several commands with one vectored syscall.
+
+        socket.sendmsg maps to writev(2), so the per-command byte
+        strings go out as-is without first being joined into one
+        temporary buffer. Short writes finish via sendall, and
+        platforms without sendmsg fall back to a joined sendall.
+        Socket errors propagate to the caller.
+        """
+        buffers = [_encode_cmd(command) for command in commands]
+
+        if hasattr(self.socket, "sendmsg"):
+            sent = self.socket.sendmsg(buffers)
+            total = sum(len(buffer) for buffer in buffers)
+            if sent < total:
+                self.socket.sendall(b"".join(buffers)[sent:])
+        else:
+            self.socket.sendall(b"".join(buffers))
+
     def _read_with_timeout(self, target=None, timeout=None):
-        """Read data with timeout, optionally until target is found."""
+        """
+        Read data with timeout, optionally until target is found.
+
+        Reads consume from the persistent self._buffer: everything up to
+        and including the target is returned, and any bytes already
+        received past it stay buffered for the next call. A request can
+        therefore be satisfied without touching the socket at all when a
+        previous read over-collected.
+        """
         if timeout is None:
             timeout = self.timeout
-            
+
         if not self.socket:
             return None
-            
-        buffer = b""
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+
+        buffer = self._buffer
+
+        # Leftovers from an earlier read may already contain the answer
+        if target:
+            idx = buffer.find(target)
+            if idx != -1:
+                end = idx + len(target)
+                data = bytes(buffer[:end])
+                del buffer[:end]
+                return data
+            scan_from = max(0, len(buffer) - len(target) + 1)
+        elif buffer:
+            data = bytes(buffer)
+            buffer.clear()
+            return data
+
+        # Use the monotonic clock so NTP steps can't stretch or cut the
+        # timeout, and give recv exactly the remaining budget each pass
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
             try:
-                data = self.socket.recv(4096)
-                if not data:
+                self.socket.settimeout(remaining)
+                received = self.socket.recv_into(self._recv_buf)
+                if not received:
                     break
-                    
-                buffer += data
-                
-                # If we're looking for a specific target
-                if target and target in buffer:
-                    return buffer
-                    
-                # If not looking for a target, return whatever we got
-                if not target:
-                    return buffer
-                    
+
+                # The bridge never negotiates telnet options; an IAC byte
+                # means we're not talking to a GNET prompt
+                if self._recv_buf.find(b"\xff", 0, received) != -1:
+                    print("Warning: unexpected telnet IAC byte in response")
+
+                buffer.extend(self._recv_view[:received])
+
+                # If we're looking for a specific target, only scan the
+                # newly appended bytes instead of rescanning the whole buffer
+                if target:
+                    idx = buffer.find(target, scan_from)
+                    if idx != -1:
+                        end = idx + len(target)
+                        data = bytes(buffer[:end])
+                        del buffer[:end]
+                        self.socket.settimeout(self.timeout)
+                        return data
+                    scan_from = max(0, len(buffer) - len(target) + 1)
+                else:
+                    # If not looking for a target, return whatever we got
+                    data = bytes(buffer)
+                    buffer.clear()
+                    self.socket.settimeout(self.timeout)
+                    return data
+
             except socket.timeout:
                 # Timeout reading, but we may still have partial data
                 break
             except Exception as e:
                 print(f"Read error: {e}")
                 break
-                
-        return buffer if buffer else None
+
+        # Restore the connection's normal timeout for later operations
+        self.socket.settimeout(self.timeout)
+
+        # Timed out or connection closed - hand back whatever arrived
+        if buffer:
+            data = bytes(buffer)
+            buffer.clear()
+            return data
+        return None
     
+    # Allocation size past which the retained receive buffer counts as
+    # burst-sized and is reallocated down once it has drained
+    _BUFFER_RELAX = 65536
+
+    def _relax_buffer(self):
+        """
+        Release a burst-sized receive buffer once it has drained.
+
+        A discovery dump can grow self._buffer to tens of KB, and a
+        partial consume doesn't always shrink the underlying allocation
+        (bytearray only reallocates on a major downsize). When the
+        allocation has outgrown the relax threshold but little data
+        remains, copy the leftover into a fresh small bytearray so a
+        long-lived connection doesn't pin one burst's worth of memory.
+        """
+        buffer = self._buffer
+        if (sys.getsizeof(buffer) > self._BUFFER_RELAX
+                and len(buffer) * 4 < self._BUFFER_RELAX):
+            self._buffer = bytearray(buffer)
+
+    def send_command_nowait(self, command):
+        """
+        Send a command without waiting for its prompt.
+
+        #OUTPUT responses carry nothing but an echo and the prompt, so
+        fire-and-forget callers return in one-way latency. The owed
+        prompt is drained by the next blocking command (or an explicit
+        drain_responses call).
+        """
+        return self.send_commands_nowait([command])
+
     def send_command(self, command, wait_response=True):
         """Send a command and optionally wait for response."""
         if not self.socket:
             print("Not connected")
             return None
-            
-        # Send the command
+
+        # Settle prompts owed by earlier no-wait sends first, so the
+        # response we read below belongs to this command
+        if self._pending_prompts:
+            self.drain_responses()
+
+        # Send the command; a failed write usually means the connection
+        # died while idle, so reconnect once and retry before giving up
         success = self._send(command)
+        if not success:
+            print("Send failed - reconnecting...")
+            self._drop_socket()
+            if not self.connect():
+                return None
+            success = self._send(command)
         if not success:
             return None
-            
+
         if wait_response:
             # Wait for prompt to return
-            response = self._read_with_timeout(b"GNET> ")
+            response = self._read_with_timeout(GNET_PROMPT)
             if response:
                 return response.decode('utf-8', errors='replace')
         
         return ""
     
+    def query(self, command, ttl=86400):
+        """
+        Send a read-only '?' query, caching the response for ttl seconds.
+
+        Bridge topology rarely changes between runs, so a repeated query
+        within the TTL is answered from memory instead of a network round
+        trip. Write commands ('#') are never cached and fall through to
+        send_command directly.
+        """
+        if not command.startswith("?"):
+            return self.send_command(command)
+
+        if not self._query_cache_loaded:
+            self._load_query_cache()
+
+        cached = self._query_cache.get(command)
+        if cached is not None:
+            response, timestamp = cached
+            if time.time() - timestamp < ttl:
+                return response
+
+        response = self.send_command(command)
+        if response:
+            self._query_cache[command] = (response, time.time())
+            self._save_query_cache()
+        return response
+
+    def _query_cache_path(self):
+        """On-disk cache location for this bridge's query responses."""
+        return os.path.expanduser(f"~/.cache/lutron_bridge_{self.host}.json")
+
+    def _load_query_cache(self):
+        """
+        Merge the on-disk query cache into memory (once per instance).
+
+        Loading a small JSON file is far cheaper than a telnet round
+        trip, so one-shot CLI processes get cache hits across restarts.
+        A missing or corrupt cache file just means cold queries.
+        """
+        self._query_cache_loaded = True
+        try:
+            with open(self._query_cache_path()) as f:
+                for command, (response, timestamp) in json.load(f).items():
+                    self._query_cache.setdefault(command, (response, timestamp))
+        except (OSError, ValueError):
+            pass
+
+    def _save_query_cache(self):
+        """Write the query cache back to disk; best-effort only."""
+        path = self._query_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({command: list(entry)
+                           for command, entry in self._query_cache.items()}, f)
+        except OSError:
+            pass
+
+    _CMD_CACHE_MAX = 512
+
     def set_light(self, zone_id, level):
         """Set a light zone to a specific level."""
         # Ensure level is in range
         level = max(0.0, min(100.0, level))
-        
-        # Format command
-        command = f"#OUTPUT,{zone_id},1,{level:.2f}"
-        
+
+        # Reuse the formatted command if we've built it before
+        key = (zone_id, level)
+        command = self._cmd_cache.get(key)
+        if command is None:
+            # Even on a miss, the zone prefix never changes - only the
+            # level needs formatting
+            prefix = self._cmd_prefix.get(zone_id)
+            if prefix is None:
+                prefix = f"#OUTPUT,{zone_id},1,"
+                self._cmd_prefix[zone_id] = prefix
+            command = prefix + f"{level:.2f}"
+            if len(self._cmd_cache) >= self._CMD_CACHE_MAX:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._cmd_cache[next(iter(self._cmd_cache))]
+            self._cmd_cache[key] = command
+
         # Send it
         print(f"Setting zone {zone_id} to {level:.1f}%")
         result = self.send_command(command, wait_response=True)
@@ -147,43 +529,191 @@ class LutronQuick:
         
         return True
     
+    def send_commands(self, commands):
+        """
+        Send several commands pipelined in one write and collect responses.
+
+        All commands are written back-to-back in a single send; the bridge
+        processes them in order, so the responses are drained by counting
+        one GNET prompt per command. Returns the list of decoded response
+        chunks, or None on error.
+        """
+        if not self.socket:
+            print("Not connected")
+            return None
+
+        # Settle prompts owed by earlier no-wait sends first
+        if self._pending_prompts:
+            self.drain_responses()
+
+        try:
+            self._send_many(commands)
+        except Exception as e:
+            print(f"Send error: {e}")
+            return None
+
+        # Drain one prompt per command (several may arrive in one read)
+        responses = []
+        pending = len(commands)
+        while pending > 0:
+            response = self._read_with_timeout(GNET_PROMPT)
+            if not response:
+                return None
+            responses.append(response.decode('utf-8', errors='replace'))
+            pending -= response.count(GNET_PROMPT)
+
+        self._relax_buffer()
+        return responses
+
+    def send_commands_nowait(self, commands):
+        """
+        Send pipelined commands without blocking on the responses.
+
+        The expected prompts are tallied in _pending_prompts; the caller
+        overlaps useful work (or a deliberate pause) with the bridge's
+        ack and settles up later via drain_responses().
+        """
+        if not self.socket:
+            print("Not connected")
+            return False
+
+        try:
+            self._send_many(commands)
+        except Exception as e:
+            print(f"Send error: {e}")
+            return False
+
+        self._pending_prompts += len(commands)
+        return True
+
+    def drain_responses(self):
+        """Consume prompts still owed by earlier no-wait sends."""
+        while self._pending_prompts > 0:
+            response = self._read_with_timeout(GNET_PROMPT)
+            if not response:
+                # Connection trouble - don't keep waiting for these
+                self._pending_prompts = 0
+                return False
+            self._pending_prompts -= response.count(GNET_PROMPT)
+
+        self._pending_prompts = 0
+        self._relax_buffer()
+        return True
+
+    def set_zone_levels(self, levels):
+        """
+        Set several zones to individual levels with one pipelined write.
+
+        levels maps zone_id -> level. Unlike set_lights_batch, each
+        zone gets its own target, so a whole scene lands in one round
+        trip instead of one per zone.
+        """
+        responses = self.send_commands(
+            [f"#OUTPUT,{zone_id},1,{max(0.0, min(100.0, level)):.2f}"
+             for zone_id, level in levels.items()]
+        )
+        if responses is None:
+            return False
+
+        for response in responses:
+            if "ERROR" in response:
+                print(f"Command error: {response}")
+                return False
+
+        return True
+
+    def discover(self):
+        """
+        Query the bridge's full topology in one pipelined exchange.
+
+        ?AREA, ?ZONE, ?OUTPUT and ?DEVICE go out back-to-back in a
+        single write, so discovery costs one round trip instead of
+        four. Returns a dict mapping each query to its response text,
+        or None on error.
+        """
+        commands = ("?AREA", "?ZONE", "?OUTPUT", "?DEVICE")
+        responses = self.send_commands(list(commands))
+        if responses is None:
+            return None
+
+        # Responses may arrive coalesced across reads; re-split the
+        # concatenated text on the prompt so each query gets its own
+        # chunk (the final prompt leaves an empty tail, dropped by zip)
+        chunks = "".join(responses).split(GNET_PROMPT.decode('ascii'))
+        return dict(zip(commands, chunks))
+
+    def set_lights_batch(self, zone_ids, level):
+        """Set several zones to the same level with one pipelined write."""
+        level = max(0.0, min(100.0, level))
+
+        responses = self.send_commands(
+            [f"#OUTPUT,{zone_id},1,{level:.2f}" for zone_id in zone_ids]
+        )
+        if responses is None:
+            return False
+
+        for response in responses:
+            if "ERROR" in response:
+                print(f"Command error: {response}")
+                return False
+
+        return True
+
     def close(self):
         """Close the connection."""
         if self.socket:
             self.socket.close()
             self.socket = None
+            # Don't let stale bytes leak into a future reconnect
+            self._buffer.clear()
+            self._pending_prompts = 0
             print("Connection closed")
 
 def main():
     parser = argparse.ArgumentParser(description='Quick Lutron light control')
     parser.add_argument('--ip', '-i', required=True, help='Bridge IP address')
-    parser.add_argument('--zone', '-z', type=str, required=True, help='Zone ID to control')
+    parser.add_argument('--zone', '-z', action='append', required=True,
+                        help='Zone to control: ID (uses --level) or ID:LEVEL. '
+                             'Repeat for several zones in one session')
     parser.add_argument('--level', '-l', type=float, default=100.0, help='Light level (0-100)')
     parser.add_argument('--timeout', '-t', type=int, default=3, help='Connection timeout')
-    
+
     args = parser.parse_args()
-    
+
+    # Resolve every zone spec before touching the network; all zones
+    # share the one connect+login, so scripted scenes pay the
+    # handshake once instead of once per zone
+    levels = {}
+    for spec in args.zone:
+        zone_id, sep, level_str = spec.partition(':')
+        try:
+            levels[zone_id] = float(level_str) if sep else args.level
+        except ValueError:
+            print(f"Invalid zone spec: {spec} (expected ID or ID:LEVEL)")
+            return 1
+
     # Create controller
     controller = LutronQuick(args.ip, timeout=args.timeout)
-    
+
     try:
         # Connect
         if not controller.connect():
             print("Failed to connect")
             return 1
-        
-        # Control the light
-        success = controller.set_light(args.zone, args.level)
-        
+
+        # Control the lights with one pipelined write
+        success = controller.set_zone_levels(levels)
+
+        zones_display = ", ".join(levels)
         if success:
-            print(f"Successfully sent command to zone {args.zone}")
+            print(f"Successfully sent commands to zone(s) {zones_display}")
         else:
-            print(f"Failed to control zone {args.zone}")
-            
+            print(f"Failed to control zone(s) {zones_display}")
+
     finally:
         # Always close the connection
         controller.close()
-        
+
     return 0
 
 if __name__ == "__main__":
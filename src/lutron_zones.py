@@ -2,17 +2,27 @@
 """
 Lutron Zones - Definitions of light zones by area with metadata
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
-@dataclass
+# slots drops the per-instance __dict__ and makes attribute access a
+# slot descriptor; frozen makes zones hashable, so they can key dicts
+# and sets directly. The table is static, so immutability costs nothing
+@dataclass(slots=True, frozen=True)
 class Zone:
     """Zone definition with metadata"""
     id: int
     name: str
     area: str = ""
     type: str = "Light"
-    
+    # Rendered once at construction; display code reuses it instead of
+    # re-formatting on every listing
+    display: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self):
+        object.__setattr__(self, 'display', f"{self.name} (Zone {self.id})")
+
+
     def to_dict(self):
         """Convert to dictionary for backward compatibility"""
         return {
@@ -45,36 +55,50 @@ KITCHEN_ALL = [
     KITCHEN["MAIN"]
 ]
 
+# Parallel id/name tuples for hot loops that only need the raw fields
+KITCHEN_IDS = tuple(zone.id for zone in KITCHEN_ALL)
+KITCHEN_NAMES = tuple(zone.name for zone in KITCHEN_ALL)
+
 # All zones in a flat list (for searching)
 ALL_ZONES = [
     *KITCHEN_ALL,
     MASTER_BEDROOM["BAY_WINDOW"]
 ]
 
+# Lookup indexes built once at import: event dispatchers map bridge
+# ids to zones per event, so keep that O(1) however large the table
+# gets. Area keys are pre-lowered so searches don't re-lower per zone
+_ZONES_BY_ID: Dict[int, Zone] = {zone.id: zone for zone in ALL_ZONES}
+_ZONES_BY_AREA: Dict[str, List[Zone]] = {}
+for _zone in ALL_ZONES:
+    _ZONES_BY_AREA.setdefault(_zone.area.lower(), []).append(_zone)
+del _zone
+
 def find_zone_by_id(zone_id: int) -> Optional[Zone]:
     """Find a zone by its ID"""
-    for zone in ALL_ZONES:
-        if zone.id == zone_id:
-            return zone
-    return None
+    return _ZONES_BY_ID.get(zone_id)
 
 def find_zones_by_area(area_name: str) -> List[Zone]:
     """Find all zones in a specific area"""
     area_lower = area_name.lower()
-    return [zone for zone in ALL_ZONES 
-            if area_lower in zone.area.lower()]
+    return [zone
+            for area, zones in _ZONES_BY_AREA.items()
+            if area_lower in area
+            for zone in zones]
 
 def get_zone_names(zones: List[Zone]) -> List[str]:
     """Get a formatted list of zone names for display"""
-    return [f"{zone.name} (Zone {zone.id})" for zone in zones]
+    return [zone.display for zone in zones]
 
 def print_zones(zones: List[Zone], title: Optional[str] = None) -> None:
     """Print a list of zones in a formatted way"""
+    # Build the whole listing first so it goes out in a single write
+    lines = []
     if title:
-        print(f"\n{title}\n")
-        print("-" * (len(title) + 2))
-    
-    for zone in zones:
-        print(f"  Zone {zone.id:>2}: {zone.name}")
-    
-    print("") 
\ No newline at end of file
+        lines.append(f"\n{title}\n\n")
+        lines.append("-" * (len(title) + 2) + "\n")
+
+    lines.extend(f"  Zone {zone.id:>2}: {zone.name}\n" for zone in zones)
+    lines.append("\n")
+
+    print("".join(lines), end="")